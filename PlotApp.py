@@ -1,32 +1,187 @@
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
-from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk, filedialog
 import tkinter as tk
+import logging
+import os
+import threading
+import time
+import numpy as np
+
+import curves
+from densityRaster import density_grid
+from diskCache import DiskCache
+from levelOfDetail import decimate
+from perfMonitor import PerfMonitor
+
+# Worker threads shared by every plotter in the process, created on first use
+_executor = None
+# Single thread running sweep exports, so a long export never holds up curve evaluation
+_export_executor = None
+
+
+def shared_executor():
+    """The process-wide thread pool used for curve evaluation"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="curve-worker")
+    return _executor
+
+
+# Environment variables that enable the persistent cache and bound its size
+DISK_CACHE_DIR_ENV = "CURVE_CACHE_DIR"
+DISK_CACHE_SIZE_ENV = "CURVE_CACHE_MB"
+DISK_CACHE_DEFAULT_MB = 512
+
+_disk_cache = None
+
+
+def shared_disk_cache():
+    """The process-wide disk cache, or None unless CURVE_CACHE_DIR names its directory
+
+    It is also installed as curves.disk_cache, so computed curves are
+    stored there and reused after a restart.
+    """
+    global _disk_cache
+    directory = os.environ.get(DISK_CACHE_DIR_ENV)
+    if _disk_cache is None and directory:
+        size_mb = float(os.environ.get(DISK_CACHE_SIZE_ENV, DISK_CACHE_DEFAULT_MB))
+        _disk_cache = DiskCache(directory, int(size_mb * 1024 * 1024))
+        curves.disk_cache = _disk_cache
+    return _disk_cache
 
 
 class PlotApp:
     """Base class for curve plotting applications"""
+    # Zoom redraws are coalesced to at most one per frame
+    ZOOM_FRAME_MS = 16
+    # A zoom gesture is considered finished after this long without scroll events
+    ZOOM_SETTLE_MS = 150
+    # Adaptive sampling resolution is rounded to this many pixels so small resizes reuse cached curves
+    RESOLUTION_STEP = 100
+    # How often finished background computations are collected on the Tk thread
+    COMPUTE_POLL_MS = 10
+    # Live slider changes are applied once dragging pauses for this long
+    LIVE_UPDATE_MS = 30
+    # Neighbouring parameter values are precomputed once a curve has been shown for this long
+    PREFETCH_DELAY_MS = 250
+    # Bytes of curve geometry one round of prefetching may add to the cache
+    PREFETCH_MAX_BYTES = curves.PREFETCH_MAX_BYTES
+    # Matplotlib style applied before the figure is created
+    PLOT_STYLE = 'ggplot'
+    # Whether the curve can be shown as a density raster instead of a line
+    SUPPORTS_DENSITY = True
+    # Colormap of the density raster
+    DENSITY_CMAP = 'magma'
+    # Pixels crossed by less curve than this many pixels of length share the lowest density color
+    DENSITY_MIN_LENGTH = 0.5
+    # Whether the plotter offers a gallery of parameter variants (see gallery_variants)
+    SUPPORTS_GALLERY = False
+    # Samples per curve in the gallery
+    GALLERY_POINTS = 2000
+
     def __init__(self, root, title="Curve Plotter"):
+        # root is either a top-level window or a frame provided by a launcher
         self.root = root
-        self.root.title(title)
-        self.root.state('zoomed')  # Make window full-screen on Windows
+        if isinstance(root, tk.Wm):
+            self.root.title(title)
+            self.root.state('zoomed')  # Make window full-screen on Windows
 
         # Configure the main window layout
         self.root.columnconfigure(0, weight=1)  # Control panel
         self.root.columnconfigure(1, weight=4)  # Plot area
         self.root.rowconfigure(0, weight=1)
 
-        # Create the plot figure
-        self.fig = Figure(figsize=(10, 8), dpi=100)
-        self.ax = self.fig.add_subplot(111)
+        # Sample curves adaptively to the plot's pixel size instead of a fixed n_points
+        self.adaptive_sampling = True
+
+        # Re-evaluate the visible part of the curve after zooming or panning
+        self.viewport_resampling = True
+        self.curve_spec = None
+        self.curve_data = None
+        self._resampled = False
+        self._view_settle_id = None
+
+        # Hand matplotlib only the vertices that are distinct at the current view and pixel size
+        self.level_of_detail = True
+        self.shown_data = None
+        self._shown_view = None
+
+        # "line" draws the curve as a Line2D, "density" as a log-scaled count raster
+        self.render_mode = "line"
 
-        # Create the UI components
+        # Per-phase timings of updates and redraws, with an optional on-screen summary
+        self.perf = PerfMonitor()
+        self._draw_start = None
+
+        # Curve evaluation runs on worker threads; results are collected with root.after
+        self.executor = shared_executor()
+        self._compute_jobs = {}
+        self._compute_poll_id = None
+        self._live_update_id = None
+        # Set while a slider and its Entry are being synced, so neither echoes back to the other
+        self._syncing_sliders = False
+
+        # Optional persistent cache; a cached raster of a curve is shown while its points load
+        self.disk_cache = shared_disk_cache()
+        self.cached_raster = None
+        self._store_raster_key = None
+
+        # Precompute the curves the user is likely to ask for next while the app is idle
+        self.prefetch = True
+        self._prefetch_id = None
+        self._prefetch_cancel = None
+
+        # Window with a grid of parameter variants, created on request
+        self.gallery_window = None
+
+        # State of an in-progress Ctrl+scroll zoom gesture
+        self._zoom_background = None
+        self._zoom_frame_id = None
+        self._zoom_settle_id = None
+
+        # Create the controls now; matplotlib is only loaded and the first curve
+        # rendered once the window is on screen
         self.create_scrollable_control_panel()
+        self.main_control_frame.bind('<Map>', self._on_first_map)
+
+    def _on_first_map(self, event):
+        """Build the plot once the window has been mapped"""
+        self.main_control_frame.unbind('<Map>')
+        self.root.after_idle(self.create_plot)
+
+    def create_plot(self):
+        """Create the figure and the plot panel, then render the first curve"""
+        self.create_figure()
         self.create_plot_panel()
 
         # Initialize the plot
         self.update_plot()
 
+    def create_figure(self):
+        """Create the matplotlib figure and the artists that are kept for its lifetime"""
+        import matplotlib.style
+        from matplotlib.figure import Figure
+
+        matplotlib.style.use(self.PLOT_STYLE)
+        self.fig = Figure(figsize=(10, 8), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+
+        # Artists are created once and then updated in place on every redraw
+        self.ax.set_aspect('equal')
+        self.ax.grid(True, linestyle='--', alpha=0.7)
+        self.title_text = self.ax.set_title("", fontsize=14)
+        self.line = None
+        self.density_image = None
+        self._layout_key = None
+
+        # Re-evaluate the visible part of the curve when the limits change
+        self.ax.callbacks.connect('xlim_changed', self._on_limits_changed)
+        self.ax.callbacks.connect('ylim_changed', self._on_limits_changed)
+
+        # Frame time overlay
+        self.hud_text = self.fig.text(0.01, 0.99, "", ha='left', va='top', fontsize=9,
+                                      family='monospace', visible=False)
+
     def create_scrollable_control_panel(self):
         """Create the left side scrollable control panel"""
         # Create the main control frame that will contain the canvas and scrollbar
@@ -60,11 +215,135 @@ class PlotApp:
         
         # Now derived classes can add their controls to self.control_frame
         self.create_control_panel()
+        if self.SUPPORTS_GALLERY:
+            self.create_gallery_controls()
+        if self.SUPPORTS_DENSITY:
+            self.create_render_controls()
+        self.create_perf_controls()
     
     def create_control_panel(self):
         """Create the controls inside the scrollable panel - to be implemented by derived classes"""
         pass
 
+    def create_gallery_controls(self):
+        """Add the button that opens the gallery of parameter variants"""
+        gallery_frame = ttk.LabelFrame(self.control_frame, text="Gallery", padding=10)
+        gallery_frame.grid(row=98, column=0, pady=(20, 0), sticky="ew")
+        gallery_frame.columnconfigure(0, weight=1)
+
+        ttk.Button(gallery_frame, text="Show Gallery", command=self.show_gallery).grid(row=0, column=0, sticky="ew")
+        ttk.Label(gallery_frame, text="(Click a variant to plot it here)").grid(row=1, column=0, sticky="w", pady=(5, 0))
+
+    def show_gallery(self):
+        """Open the gallery window, or rebuild it for the current parameters if it is already open"""
+        from galleryView import GalleryWindow
+
+        if self.gallery_window is not None and self.gallery_window.exists():
+            self.gallery_window.refresh()
+        else:
+            self.gallery_window = GalleryWindow(self)
+
+    def gallery_variants(self):
+        """(curve_type, [(label, params), ...], columns) of the gallery grid
+
+        Only called when SUPPORTS_GALLERY is set; derived classes that set it
+        implement this.
+        """
+        pass
+
+    def gallery_curves(self, curve_type, variants):
+        """(x, y) arrays with one row per gallery variant, evaluated in one batch"""
+        return curves.evaluate_batch(curve_type, self.GALLERY_POINTS, self.max_theta,
+                                     [params for _, params in variants])
+
+    def gallery_color(self):
+        """Color of the gallery curves: that of the main view's curve"""
+        return self.line.get_color() if self.line is not None else 'black'
+
+    def load_parameters(self, params):
+        """Show a gallery variant in the main view
+
+        Only called when SUPPORTS_GALLERY is set; derived classes that set it
+        implement this.
+        """
+        pass
+
+    def create_render_controls(self):
+        """Add the choice between drawing the curve as a line or as a density raster"""
+        render_frame = ttk.LabelFrame(self.control_frame, text="Rendering", padding=10)
+        render_frame.grid(row=99, column=0, pady=(20, 0), sticky="ew")
+
+        self.render_mode_var = tk.StringVar(value=self.render_mode)
+        ttk.Radiobutton(render_frame, text="Line", variable=self.render_mode_var, value="line",
+                        command=self.on_render_mode_change).grid(row=0, column=0, sticky="w", pady=(0, 5))
+        ttk.Radiobutton(render_frame, text="Density (log scale)", variable=self.render_mode_var, value="density",
+                        command=self.on_render_mode_change).grid(row=1, column=0, sticky="w")
+
+    def on_render_mode_change(self):
+        """Redraw the current data in the selected render mode"""
+        self.render_mode = self.render_mode_var.get()
+        if self.shown_data is not None:
+            self.show_curve_data(*self.shown_data)
+            self.canvas.draw_idle()
+
+    def create_perf_controls(self):
+        """Add the performance HUD toggle and timing export below the derived class's controls"""
+        perf_frame = ttk.LabelFrame(self.control_frame, text="Performance", padding=10)
+        perf_frame.grid(row=100, column=0, pady=(20, 0), sticky="ew")
+        perf_frame.columnconfigure(0, weight=1)
+
+        self.hud_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(perf_frame, text="Show frame times on plot", variable=self.hud_var,
+                        command=lambda: self.show_hud(self.hud_var.get())).grid(row=0, column=0, sticky="w")
+        ttk.Button(perf_frame, text="Export Timings...", command=self.export_timings).grid(row=1, column=0, sticky="ew", pady=(5, 0))
+
+    def show_hud(self, visible):
+        """Show or hide the frame time overlay"""
+        if not hasattr(self, 'canvas'):
+            return
+        self.hud_text.set_text(self.perf.format_summary())
+        self.hud_text.set_visible(visible)
+        self.canvas.draw_idle()
+
+    def export_timings(self):
+        """Ask for a file name and dump the timing ring buffer to JSON or CSV"""
+        path = filedialog.asksaveasfilename(defaultextension=".json",
+                                            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")])
+        if path:
+            self.perf.dump(path)
+
+    def vertex_count(self):
+        """Number of vertices currently handed to matplotlib, or binned into the density raster"""
+        if self.render_mode == "density":
+            return len(self.shown_data[0]) if self.shown_data is not None else 0
+        return len(self.line.get_xdata()) if self.line is not None else 0
+
+    def before_draw(self):
+        """Called by the canvas just before a full draw"""
+        if self.perf.active:
+            self.perf.mark("idle")
+        if self.hud_text.get_visible():
+            self.hud_text.set_text(self.perf.format_summary())
+        self._draw_start = time.perf_counter()
+
+    def after_draw(self):
+        """Called by the canvas once a full draw has finished"""
+        if self.perf.active:
+            self.perf.mark("draw")
+            self.perf.end(self.vertex_count())
+        else:
+            self.perf.record("redraw", self.vertex_count(), draw=time.perf_counter() - self._draw_start)
+        if self._store_raster_key is not None:
+            self.store_raster()
+
+    def apply_changes(self):
+        """Time and run the derived class's on_apply"""
+        self.perf.begin("apply")
+        self.on_apply()
+        if not self.perf.has_phases:
+            # Nothing was updated, e.g. the input was rejected
+            self.perf.cancel()
+
     def _configure_canvas(self, event):
         # Update the width of the canvas window when the canvas is resized
         if self.control_canvas.winfo_width() > 1:  # Check if width is valid
@@ -99,6 +378,9 @@ class PlotApp:
 
     def create_plot_panel(self):
         """Create the right side plot panel"""
+        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+        from instrumentedCanvas import InstrumentedCanvas
+
         # Create frame for the plot
         plot_frame = ttk.Frame(self.root)
         plot_frame.grid(row=0, column=1, sticky="nsew")
@@ -107,7 +389,7 @@ class PlotApp:
         plot_frame.rowconfigure(1, weight=0)
 
         # Create matplotlib figure and canvas
-        self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
+        self.canvas = InstrumentedCanvas(self.fig, plot_frame, self)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
 
         # Add toolbar
@@ -122,11 +404,375 @@ class PlotApp:
         # Connect double-click event for resetting view
         self.canvas.mpl_connect('button_press_event', self.on_button_press)
 
+        # Recompute the layout when the figure is resized
+        self.canvas.mpl_connect('resize_event', self.on_resize)
+
     def update_plot(self):
         """Update the plot with current parameters"""
         # This should be implemented by derived classes
         pass
 
+    def create_live_sliders(self, parent, row, sliders):
+        """Add an optional set of sliders that update the plot live while dragging
+
+        sliders is a list of (label, variable, from_, to, integer) tuples, where
+        variable is the StringVar of the matching Entry. The sliders are hidden
+        until the "Live sliders" checkbox is ticked. Each slider follows its
+        variable whenever it is set, e.g. by Apply, Reset View or the gallery.
+        """
+        slider_frame = ttk.Frame(parent)
+        slider_frame.columnconfigure(1, weight=1)
+
+        for i, (label, variable, from_, to, integer) in enumerate(sliders):
+            ttk.Label(slider_frame, text=label).grid(row=i, column=0, sticky="w", padx=(0, 10))
+            scale = ttk.Scale(slider_frame, from_=from_, to=to, orient="horizontal",
+                              command=lambda value, var=variable, integer=integer: self._on_slider(var, value, integer))
+            self._sync_slider(scale, variable)
+            variable.trace_add("write", lambda *args, scale=scale, var=variable: self._sync_slider(scale, var))
+            scale.grid(row=i, column=1, sticky="ew", pady=2)
+
+        self.live_sliders_var = tk.BooleanVar(value=False)
+
+        def toggle():
+            if self.live_sliders_var.get():
+                slider_frame.grid(row=row + 1, column=0, columnspan=2, sticky="ew", pady=(5, 0))
+            else:
+                slider_frame.grid_forget()
+
+        ttk.Checkbutton(parent, text="Live sliders", variable=self.live_sliders_var,
+                        command=toggle).grid(row=row, column=0, columnspan=2, sticky="w", pady=(10, 0))
+
+    def _sync_slider(self, scale, variable):
+        """Move a slider to its variable's value without running the slider's command"""
+        if self._syncing_sliders:
+            return
+        try:
+            value = float(variable.get())
+        except ValueError:
+            return
+        # ttk.Scale runs its command on every set, not just on drags
+        self._syncing_sliders = True
+        try:
+            scale.set(value)
+        finally:
+            self._syncing_sliders = False
+
+    def _on_slider(self, variable, value, integer):
+        """Copy a slider value into its Entry and schedule a debounced live update"""
+        if self._syncing_sliders:
+            return
+        value = float(value)
+        self._syncing_sliders = True
+        try:
+            variable.set(str(int(round(value))) if integer else f"{value:.2f}")
+        finally:
+            self._syncing_sliders = False
+        if self._live_update_id is not None:
+            self.root.after_cancel(self._live_update_id)
+        self._live_update_id = self.root.after(self.LIVE_UPDATE_MS, self.on_live_change)
+
+    def on_live_change(self):
+        """Apply slider changes - derived classes may override to validate silently"""
+        self._live_update_id = None
+        self.apply_changes()
+
+    def sampling_resolution(self):
+        """Pixel size of the plot area used for adaptive sampling, or None for uniform sampling"""
+        if not self.adaptive_sampling:
+            return None
+        bbox = self.ax.bbox
+        pixels = max(min(bbox.width, bbox.height), self.RESOLUTION_STEP)
+        return int(np.ceil(pixels / self.RESOLUTION_STEP) * self.RESOLUTION_STEP)
+
+    def submit_compute(self, slot, on_done, func, *args, **kwargs):
+        """Run func on a worker thread and pass its result to on_done on the Tk thread
+
+        A new request in the same slot supersedes the previous one: it is
+        cancelled if it has not started yet and its result is dropped otherwise.
+        """
+        self.cancel_compute(slot)
+        self.track_compute(slot, on_done, self.executor.submit(func, *args, **kwargs))
+
+    def track_compute(self, slot, on_done, future):
+        """Pass the result of a future from any executor to on_done on the Tk thread, as for submit_compute"""
+        self._compute_jobs[slot] = (future, on_done)
+        if self._compute_poll_id is None:
+            self._compute_poll_id = self.root.after(self.COMPUTE_POLL_MS, self._poll_compute)
+
+    def cancel_compute(self, slot):
+        """Cancel the pending request in slot, if any"""
+        job = self._compute_jobs.pop(slot, None)
+        if job is not None:
+            job[0].cancel()
+
+    def _poll_compute(self):
+        """Hand finished background results to their callbacks on the Tk thread
+
+        Failures, in the worker or in the callback, go to on_compute_error;
+        the poll for the other slots is scheduled first, so it keeps running
+        either way.
+        """
+        self._compute_poll_id = None
+        finished = [(slot, job) for slot, job in self._compute_jobs.items() if job[0].done()]
+        for slot, _ in finished:
+            del self._compute_jobs[slot]
+        if self._compute_jobs:
+            self._compute_poll_id = self.root.after(self.COMPUTE_POLL_MS, self._poll_compute)
+
+        for slot, (future, on_done) in finished:
+            if future.cancelled():
+                continue
+            error = future.exception()
+            try:
+                if error is None:
+                    on_done(future.result())
+            except Exception as e:
+                error = e
+            if error is not None:
+                self.on_compute_error(slot, error)
+
+    def on_compute_error(self, slot, error):
+        """Called on the Tk thread when a background computation fails - derived classes may override to report it"""
+        logging.getLogger(__name__).error("Background computation in slot %r failed", slot,
+                                          exc_info=(type(error), error, error.__traceback__))
+        self.perf.cancel()
+
+    def plot_curve(self, curve_type, params, color, title):
+        """Evaluate a named curve from the curves module in the background and show it"""
+        # The first render happens once the plot panel exists
+        if not hasattr(self, 'canvas'):
+            return
+        self.perf.mark("validate")
+
+        # The user has acted, so any prefetching for the previous curve is moot
+        self.cancel_prefetch()
+
+        # Show the curve as last rendered at this size while its points are loaded
+        raster_key = self.raster_key(curve_type, params, color, title)
+        raster = self.disk_cache.get_raster(raster_key) if raster_key is not None else None
+        if raster is not None:
+            self.show_cached_raster(raster)
+
+        def on_done(data):
+            self.perf.mark("compute")
+            self.curve_spec = (curve_type, params)
+            self.curve_data = data
+            self._resampled = False
+            self.hide_cached_raster()
+            self.draw_curve(data[0], data[1], color, title)
+            if raster is None:
+                self._store_raster_key = raster_key
+            self.schedule_prefetch()
+
+        # A new curve makes any pending viewport re-evaluation obsolete
+        self.cancel_compute("viewport")
+        self.submit_compute("curve", on_done, curves.evaluate, curve_type, self.n_points, self.max_theta,
+                            resolution=self.sampling_resolution(), **params)
+
+    def prefetch_candidates(self, curve_type, params):
+        """(curve_type, params) pairs likely to be plotted next, most likely first
+
+        By default every whole-number parameter one step up and down, as
+        long as it stays positive. Derived classes may override this with
+        what their controls allow.
+        """
+        candidates = []
+        for name, value in params.items():
+            if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+                for step in (1, -1):
+                    if value + step >= 1:
+                        candidates.append((curve_type, dict(params, **{name: value + step})))
+        return candidates
+
+    def schedule_prefetch(self):
+        """Start prefetching once the app has been idle for PREFETCH_DELAY_MS"""
+        self.cancel_prefetch()
+        if self.prefetch and self.curve_spec is not None:
+            self._prefetch_id = self.root.after(self.PREFETCH_DELAY_MS, self.start_prefetch)
+
+    def start_prefetch(self):
+        """Evaluate the prefetch candidates on a worker thread into the shared curve cache"""
+        self._prefetch_id = None
+        candidates = self.prefetch_candidates(*self.curve_spec)
+        if not candidates:
+            return
+        self._prefetch_cancel = threading.Event()
+        self.executor.submit(curves.prefetch, candidates, self.n_points, self.max_theta,
+                             self.sampling_resolution(), self.PREFETCH_MAX_BYTES, self._prefetch_cancel)
+
+    def cancel_prefetch(self):
+        """Drop a scheduled prefetch and stop a running one before its next curve"""
+        if self._prefetch_id is not None:
+            self.root.after_cancel(self._prefetch_id)
+            self._prefetch_id = None
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
+
+    def raster_key(self, curve_type, params, color, title):
+        """Disk cache key of the rendered curve at the current figure size, or None without a disk cache"""
+        if self.disk_cache is None:
+            return None
+        width, height = self.canvas.get_width_height(physical=True)
+        curve_key = curves.CurveCache.make_key(curve_type, self.n_points, self.max_theta, params,
+                                               self.sampling_resolution())
+        return ("raster", curve_key, color, title, self.render_mode, self.PLOT_STYLE,
+                width, height, self.fig.dpi)
+
+    def show_cached_raster(self, raster):
+        """Cover the figure with a previously rendered image of it"""
+        if self.cached_raster is None:
+            self.cached_raster = self.fig.figimage(raster, origin='upper', zorder=10)
+        else:
+            self.cached_raster.set_data(raster)
+        self.canvas.draw_idle()
+
+    def hide_cached_raster(self):
+        """Remove the cached image once the live artists are ready"""
+        if self.cached_raster is not None:
+            self.cached_raster.remove()
+            self.cached_raster = None
+
+    def store_raster(self):
+        """Write the figure just drawn to the disk cache on a worker thread
+
+        Only a draw of the freshly fitted view at the size the key was made
+        for is stored, and never one showing the frame time overlay.
+        """
+        key, self._store_raster_key = self._store_raster_key, None
+        rgba = np.asarray(self.canvas.buffer_rgba())
+        if (self.hud_text.get_visible() or self._resampled or self._zoom_background is not None
+                or rgba.shape[1::-1] != key[-3:-1]):
+            return
+        self.executor.submit(self.disk_cache.put_raster, key, rgba.copy())
+
+    def export_sweep(self, parameter, values, path, fps=30, workers=None, on_done=None):
+        """Export an animation sweeping one parameter of the current curve, e.g. wing_amplitude
+
+        Frames are rendered off-screen at the current figure size; see
+        sweepExport.export_sweep for the output formats. The export runs on
+        its own thread, with worker processes started by "spawn" rather than
+        forked from this process and its Tk connection. on_done gets the
+        number of frames on the Tk thread, and failures go to
+        on_compute_error. Plotters that do not draw one named curve, such as
+        the star polygon, raise ValueError.
+        """
+        import sweepExport
+
+        if self.curve_spec is None:
+            raise ValueError(f"{type(self).__name__} has no curve to sweep")
+        global _export_executor
+        if _export_executor is None:
+            _export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sweep-export")
+
+        curve_type, params = self.curve_spec
+        future = _export_executor.submit(sweepExport.export_sweep, curve_type, params, parameter, values, path,
+                                         self.n_points, self.max_theta, fps=fps,
+                                         figsize=tuple(self.fig.get_size_inches()), dpi=self.fig.dpi,
+                                         workers=workers, context="spawn")
+        self.track_compute("sweep", on_done or (lambda count: None), future)
+
+    def draw_curve(self, x, y, color, title):
+        """Show (x, y) on the retained curve artist, fit the limits and request a redraw"""
+        if self.line is None:
+            self.line, = self.ax.plot([], [], color=color, linewidth=1.5)
+        else:
+            self.line.set_color(color)
+
+        self.set_title(title)
+
+        # Get good limits based on the data; a curve without finite points gets a unit view
+        max_range = max(np.nanmax(np.abs(x)), np.nanmax(np.abs(y))) if np.isfinite(x).any() else 0.0
+        if not max_range > 0:
+            max_range = 1.0
+        self.ax.set_xlim(-max_range*1.1, max_range*1.1)
+        self.ax.set_ylim(-max_range*1.1, max_range*1.1)
+
+        # Lay out first, so the data is decimated for the axes size it will be drawn at
+        self.update_layout()
+        self.ax.apply_aspect()
+        self.perf.mark("layout")
+        self.show_curve_data(x, y)
+        self.perf.mark("artists")
+        self.canvas.draw_idle()
+
+    def show_curve_data(self, x, y):
+        """Put full-resolution (x, y) on the curve artist, decimated to the current view if enabled
+
+        The full arrays are kept in shown_data so the view can be
+        re-decimated when it changes.
+        """
+        self.shown_data = (x, y)
+        self._shown_view = self.view_key()
+        if self.render_mode == "density":
+            self.line.set_visible(False)
+            self.show_density(x, y)
+            return
+        self.line.set_visible(True)
+        if self.density_image is not None:
+            self.density_image.set_visible(False)
+
+        if self.level_of_detail:
+            bbox = self.ax.bbox
+            x, y = decimate(x, y, self.ax.get_xlim(), self.ax.get_ylim(),
+                            max(int(bbox.width), 1), max(int(bbox.height), 1))
+        self.line.set_data(x, y)
+
+    def view_key(self):
+        """Limits and pixel size of the axes, which decimation and density binning depend on"""
+        bbox = self.ax.bbox
+        return self.ax.get_xlim(), self.ax.get_ylim(), int(bbox.width), int(bbox.height)
+
+    def show_density(self, x, y):
+        """Bin (x, y) into a pixel-resolution density grid for the current view and show it log-scaled"""
+        from matplotlib.colors import LogNorm
+
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        bbox = self.ax.bbox
+        counts = density_grid(x, y, xlim, ylim, max(int(bbox.width), 1), max(int(bbox.height), 1))
+        # Empty pixels are masked by the log scale and show the axes background;
+        # pixels with less than DENSITY_MIN_LENGTH of curve get the lowest color
+        vmax = max(counts.max(), 2 * self.DENSITY_MIN_LENGTH)
+
+        if self.density_image is None:
+            self.density_image = self.ax.imshow(counts, extent=(*xlim, *ylim), origin='lower',
+                                                cmap=self.DENSITY_CMAP, norm=LogNorm(vmin=self.DENSITY_MIN_LENGTH, vmax=vmax),
+                                                interpolation='nearest', zorder=2)
+            # imshow fits the limits to the image; keep the view as it was
+            self.ax.set_xlim(xlim, emit=False)
+            self.ax.set_ylim(ylim, emit=False)
+        else:
+            self.density_image.set_data(counts)
+            self.density_image.set_extent((*xlim, *ylim))
+            self.density_image.set_clim(self.DENSITY_MIN_LENGTH, vmax)
+        self.density_image.set_visible(True)
+
+    def set_title(self, title):
+        """Update the axes title text in place"""
+        if self.title_text.get_text() != title:
+            self.title_text.set_text(title)
+
+    def refresh(self):
+        """Recompute the layout if needed and schedule a redraw"""
+        self.update_layout()
+        self.perf.mark("layout")
+        self.canvas.draw_idle()
+
+    def update_layout(self):
+        """Run tight_layout only when the title or the figure size has changed"""
+        layout_key = (self.title_text.get_text(), tuple(self.fig.get_size_inches()))
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self.fig.tight_layout()
+
+    def on_resize(self, event):
+        """Handle canvas resize events"""
+        self.update_layout()
+
+        # The pixel size changed, so the level of detail has to be refreshed
+        self._on_limits_changed(self.ax)
+
     def on_scroll(self, event):
         """Handle scroll events for zooming"""
         if event.key == 'control':
@@ -156,7 +802,103 @@ class PlotApp:
             self.ax.set_ylim([ydata - new_height * (ydata - cur_ylim[0]) / (cur_ylim[1] - cur_ylim[0]),
                              ydata + new_height * (cur_ylim[1] - ydata) / (cur_ylim[1] - cur_ylim[0])])
 
-            self.canvas.draw()
+            # Coalesce redraws: only the latest limits are drawn, once per frame
+            if self._zoom_background is None:
+                self._start_zoom_gesture()
+            if self._zoom_frame_id is None:
+                self._zoom_frame_id = self.root.after(self.ZOOM_FRAME_MS, self._draw_zoom_frame)
+
+            # Restart the settle timer on every tick of the gesture
+            if self._zoom_settle_id is not None:
+                self.root.after_cancel(self._zoom_settle_id)
+            self._zoom_settle_id = self.root.after(self.ZOOM_SETTLE_MS, self._finish_zoom_gesture)
+
+    def animated_artists(self):
+        """Artists redrawn on top of the cached background while zooming"""
+        if self.render_mode == "density" and self.density_image is not None:
+            return [self.density_image]
+        return [self.line] if self.line is not None else []
+
+    def _start_zoom_gesture(self):
+        """Cache the static background (grid, title) as a bitmap for blitting"""
+        self.cancel_prefetch()
+        # The view is about to change, and the draw below leaves the animated curve out,
+        # so a raster still waiting for the first draw of the fitted view must not be stored
+        self._store_raster_key = None
+        for artist in self.animated_artists():
+            artist.set_animated(True)
+        self.canvas.draw()
+        self._zoom_background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _draw_zoom_frame(self):
+        """Blit the animated artists at the latest zoom limits over the cached background"""
+        self._zoom_frame_id = None
+        if self._zoom_background is None:
+            return
+        start = time.perf_counter()
+        self.canvas.restore_region(self._zoom_background)
+        for artist in self.animated_artists():
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+        self.perf.record("zoom", self.vertex_count(), blit=time.perf_counter() - start)
+
+    def _finish_zoom_gesture(self):
+        """Return to normal rendering and do one full draw once the gesture settles"""
+        self._zoom_settle_id = None
+        if self._zoom_frame_id is not None:
+            self.root.after_cancel(self._zoom_frame_id)
+            self._zoom_frame_id = None
+        for artist in self.animated_artists():
+            artist.set_animated(False)
+        self._zoom_background = None
+        self.canvas.draw_idle()
+
+    def _on_limits_changed(self, ax):
+        """Debounce view changes from zooming, panning and the toolbar"""
+        if self._view_settle_id is not None:
+            self.root.after_cancel(self._view_settle_id)
+        self._view_settle_id = self.root.after(self.ZOOM_SETTLE_MS, self.on_view_settled)
+
+    def on_view_settled(self):
+        """Re-evaluate the curve over the visible θ ranges once the view stops changing
+
+        Without viewport resampling, the current data is only decimated or
+        re-binned again for the new view.
+        """
+        self._view_settle_id = None
+        redisplay = self.level_of_detail or self.render_mode == "density"
+        if self.curve_spec is None or not (self.viewport_resampling or redisplay):
+            return
+        if self._zoom_background is not None or "curve" in self._compute_jobs:
+            # Still zooming or computing, check again later
+            self._view_settle_id = self.root.after(self.ZOOM_SETTLE_MS, self.on_view_settled)
+            return
+
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        x, y = self.curve_data
+        if not self.viewport_resampling or not np.isfinite(x).any() or (
+                xlim[0] <= np.nanmin(x) and np.nanmax(x) <= xlim[1] and
+                ylim[0] <= np.nanmin(y) and np.nanmax(y) <= ylim[1]):
+            # The whole curve is in view, so the full evaluation is already the right one;
+            # it only needs showing again if it was decimated or binned for another view
+            if self._resampled or (redisplay and self.view_key() != self._shown_view):
+                self.show_curve_data(x, y)
+                self._resampled = False
+                self.canvas.draw_idle()
+            return
+
+        def on_done(data):
+            self.perf.mark("compute")
+            self.show_curve_data(*data)
+            self._resampled = True
+            self.perf.mark("artists")
+            self.canvas.draw_idle()
+
+        self.perf.begin("viewport")
+        curve_type, params = self.curve_spec
+        self.submit_compute("viewport", on_done, curves.evaluate_viewport, curve_type, self.max_theta,
+                            xlim, ylim, self.ax.bbox.width, **params)
 
     def on_button_press(self, event):
         """Handle mouse button events"""
@@ -171,4 +913,4 @@ class PlotApp:
         # Reset the ax view limits to show the whole plot
         self.ax.relim()  # Recalculate limits
         self.ax.autoscale_view(True, True, True)  # Auto-scale the view
-        self.canvas.draw()  # Redraw the canvas
\ No newline at end of file
+        self.canvas.draw_idle()  # Redraw the canvas
\ No newline at end of file
@@ -0,0 +1,171 @@
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+import curves
+from expressionEngine import RESERVED_NAMES
+from renderCommon import curve_title, make_agg_figure, parse_value
+
+# Default sampling and colors, matching the interactive plotters
+DEFAULT_N_POINTS = {"butterfly": 5000}
+DEFAULT_PETAL_N_POINTS = 3000
+DEFAULT_MAX_THETA = 24 * np.pi
+CURVE_COLORS = {
+    "butterfly": 'purple',
+    "spiral_sin": 'darkviolet',
+    "spiral_cos": 'crimson',
+    "rhodonea_sin": 'darkblue',
+    "rhodonea_cos": 'darkgreen',
+    "polar_expression": 'teal',
+    "parametric_expression": 'darkorange',
+}
+# Grid columns that are not curve parameters, and the reserved names a job may still set
+JOB_KEYS = ("curve", "name", "n_points", "max_theta")
+JOB_SETTINGS = {"n_points", "max_theta", "expression", "x_expression", "y_expression"}
+
+# Per-process figure, created once by the pool initializer and reused for every job
+_worker = {}
+
+
+def load_grid(path):
+    """Read a parameter grid from a CSV or JSON file
+
+    A CSV file has one job per row, with a "curve" column and one column per
+    parameter. A JSON file is either a list of such job objects, or an object
+    mapping each key to a list of values, which is expanded into every
+    combination (e.g. {"curve": ["spiral_sin", "rhodonea_cos"], "n_petals": [1, 2, 3]}).
+    """
+    if path.lower().endswith(".json"):
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            keys = list(data)
+            values = [v if isinstance(v, list) else [v] for v in data.values()]
+            return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+        return data
+
+    with open(path, newline="") as f:
+        return [{key: parse_value(value) for key, value in row.items() if value != ""}
+                for row in csv.DictReader(f)]
+
+
+def check_job(job):
+    """Raise ValueError if a job has no curve or sets a name reserved for evaluation"""
+    if "curve" not in job:
+        raise ValueError(f"Job {job} has no curve")
+    reserved = sorted(set(job) & RESERVED_NAMES - JOB_SETTINGS)
+    if reserved:
+        raise ValueError(f"Job {job} sets reserved name(s) {', '.join(reserved)}")
+
+
+def job_name(job):
+    """Build a file name from the curve type and its parameters
+
+    String values such as expressions may hold characters that are not
+    allowed in file names, so they are replaced by a short hash.
+    """
+    params = "_".join(
+        f"{key}-{hashlib.sha256(value.encode('utf-8')).hexdigest()[:8]}" if isinstance(value, str)
+        else f"{key}-{value}"
+        for key, value in job.items() if key not in ("curve", "name"))
+    return job.get("name") or f"{job['curve']}_{params}".rstrip("_")
+
+
+def _init_worker(figsize, dpi, style):
+    """Create the Agg figure and retained artists used by this worker process"""
+    fig, _, ax = make_agg_figure(figsize, dpi, style)
+    polygon_line, = ax.plot([], [], 'b--', alpha=0.5)
+    line, = ax.plot([], [], linewidth=1.5)
+    _worker.update(fig=fig, ax=ax, line=line, polygon_line=polygon_line)
+
+
+def render_job(job, out_dir, formats):
+    """Render one job from the grid onto the worker's figure and save it in each format"""
+    fig = _worker["fig"]
+    ax = _worker["ax"]
+    line = _worker["line"]
+    polygon_line = _worker["polygon_line"]
+
+    curve_type = job["curve"]
+    params = {key: value for key, value in job.items() if key not in JOB_KEYS}
+
+    if curve_type == "star_polygon":
+        x, y = curves.star_polygon_vertices(params["p"])
+        points_x, points_y = curves.star_polygon(params["p"], params["q"])
+        polygon_line.set_data(np.append(x, x[0]), np.append(y, y[0]))
+        polygon_line.set_visible(True)
+        line.set_data(points_x, points_y)
+        line.set_color('r')
+        max_range = 1.0
+        title = f"Star Polygon {{p/q}} = {{{params['p']}/{params['q']}}}"
+    else:
+        n_points = job.get("n_points", DEFAULT_N_POINTS.get(curve_type, DEFAULT_PETAL_N_POINTS))
+        max_theta = job.get("max_theta", DEFAULT_MAX_THETA)
+        x, y = curves.evaluate(curve_type, n_points, max_theta, use_cache=False, **params)
+        polygon_line.set_visible(False)
+        line.set_data(x, y)
+        line.set_color(CURVE_COLORS[curve_type])
+        max_range = max(np.nanmax(np.abs(x)), np.nanmax(np.abs(y)))
+        title = curve_title(curve_type, params)
+
+    ax.set_xlim(-max_range*1.1, max_range*1.1)
+    ax.set_ylim(-max_range*1.1, max_range*1.1)
+    ax.set_title(title, fontsize=14)
+
+    name = job_name(job)
+    for fmt in formats:
+        fig.savefig(os.path.join(out_dir, f"{name}.{fmt}"), format=fmt)
+    return name
+
+
+def _render_task(args):
+    return render_job(*args)
+
+
+def render_grid(jobs, out_dir, formats=("png",), workers=None, figsize=(10, 8), dpi=100, style='ggplot'):
+    """Render every job across a process pool and return the elapsed time in seconds
+
+    All jobs are checked before the pool starts, so a bad grid fails at once.
+    """
+    jobs = list(jobs)
+    for job in jobs:
+        check_job(job)
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(figsize, dpi, style)) as pool:
+        tasks = ((job, out_dir, formats) for job in jobs)
+        for _ in pool.imap_unordered(_render_task, tasks, chunksize=4):
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a grid of curves to image files without opening a window")
+    parser.add_argument("grid", help="CSV or JSON file describing the parameter grid")
+    parser.add_argument("-o", "--out-dir", default="renders", help="Directory for the rendered images")
+    parser.add_argument("-f", "--format", action="append", choices=["png", "svg"],
+                        help="Output format; repeat for several (default: png)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--size", type=float, nargs=2, default=(10, 8), metavar=("WIDTH", "HEIGHT"),
+                        help="Figure size in inches")
+    args = parser.parse_args()
+
+    jobs = load_grid(args.grid)
+    try:
+        elapsed = render_grid(jobs, args.out_dir, tuple(args.format or ["png"]), args.workers,
+                              tuple(args.size), args.dpi)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Rendered {len(jobs)} figures in {elapsed:.2f} s ({len(jobs) / elapsed:.1f} images/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import curves
+from renderCommon import make_agg_figure
+
+# Parameters matching each plotter's defaults
+BENCH_CURVES = {
+    "butterfly": {"wing_frequency": 4, "wing_amplitude": 2, "sine_stretch": 24},
+    "spiral_sin": {"n_petals": 3},
+    "spiral_cos": {"n_petals": 3},
+    "rhodonea_sin": {"n_petals": 3, "face_radius": 1},
+    "rhodonea_cos": {"n_petals": 3, "face_radius": 1},
+}
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+DEFAULT_STAR_SIZES = [10, 10**2, 10**3, 10**4, 10**5]
+ENTRY_MODULES = ["butterflyCurvePlotter", "petalPlotter", "starPolygonPlotter", "customCurvePlotter"]
+MAX_THETA = 24 * np.pi
+# Plot size in pixels for the adaptive evaluation benchmark, about what the default window gives
+ADAPTIVE_RESOLUTION = 700
+
+
+def best_of(repeat, stages):
+    """Run the stages in order repeat times and keep the fastest time of each
+
+    stages is a list of (name, func) pairs; each func receives the previous
+    stage's result.
+    """
+    best = {}
+    for _ in range(repeat):
+        value = None
+        for name, func in stages:
+            start = time.perf_counter()
+            value = func(value)
+            elapsed = time.perf_counter() - start
+            best[name] = min(best.get(name, elapsed), elapsed)
+    return best
+
+
+def bench_curve(curve_type, n_points, repeat):
+    """Time each stage of evaluating and drawing one polar curve
+
+    "radius" and "cartesian" time the plain radius function and conversion;
+    "curve" times the chunked in-place kernel the built-in curves run, and
+    "evaluate" the uncached uniform evaluation the plotters run, including
+    the period and symmetry shortcuts.
+    """
+    params = BENCH_CURVES[curve_type]
+    radius = curves.RADII[curve_type]
+    fig, canvas, ax = make_agg_figure()
+    state = {}
+
+    def theta_stage(_):
+        state["theta"] = curves.theta_range(MAX_THETA, n_points)
+
+    def radius_stage(_):
+        state["r"] = radius(state["theta"], **params)
+
+    def cartesian_stage(_):
+        state["xy"] = curves.polar_to_cartesian(state["r"], state["theta"])
+
+    def curve_stage(_):
+        state["xy"] = curves.CURVES[curve_type](state["theta"], **params)
+
+    def evaluate_stage(_):
+        curves.evaluate(curve_type, n_points, MAX_THETA, use_cache=False, **params)
+
+    def artist_stage(_):
+        for line in list(ax.lines):
+            line.remove()
+        x, y = state["xy"]
+        ax.plot(x, y, linewidth=1.5)
+        ax.set_title(f"{curve_type}\n{n_points} points", fontsize=14)
+        max_range = max(np.nanmax(np.abs(x)), np.nanmax(np.abs(y)))
+        ax.set_xlim(-max_range*1.1, max_range*1.1)
+        ax.set_ylim(-max_range*1.1, max_range*1.1)
+
+    return best_of(repeat, [
+        ("theta", theta_stage),
+        ("radius", radius_stage),
+        ("cartesian", cartesian_stage),
+        ("curve", curve_stage),
+        ("evaluate", evaluate_stage),
+        ("artists", artist_stage),
+        ("tight_layout", lambda _: fig.tight_layout()),
+        ("draw", lambda _: canvas.draw()),
+    ])
+
+
+def bench_adaptive(curve_type, repeat):
+    """Time the uncached adaptive evaluation the plotters run by default"""
+    params = BENCH_CURVES[curve_type]
+    return best_of(repeat, [
+        ("evaluate", lambda _: curves.evaluate(curve_type, 0, MAX_THETA, use_cache=False,
+                                               resolution=ADAPTIVE_RESOLUTION, **params)),
+    ])
+
+
+def bench_star(p, repeat):
+    """Time each stage of building and drawing the star polygon {p/q} with q just below p/2"""
+    from matplotlib.collections import LineCollection
+
+    q = (p - 1) // 2
+    while q > 1 and np.gcd(p, q) != 1:
+        q -= 1
+    fig, canvas, ax = make_agg_figure()
+    ax.set_xlim(-1.2, 1.2)
+    ax.set_ylim(-1.2, 1.2)
+    state = {}
+
+    def vertex_stage(_):
+        state["vertices"] = curves.star_polygon_vertices(p)
+
+    def segment_stage(_):
+        state["segments"] = curves.star_polygon_segments(p, q)
+
+    def artist_stage(_):
+        for collection in list(ax.collections):
+            collection.remove()
+        ax.add_collection(LineCollection(state["segments"], colors='r', linewidths=1.5))
+        ax.set_title(f"Star Polygon {{{p}/{q}}}", fontsize=14)
+
+    return best_of(repeat, [
+        ("vertices", vertex_stage),
+        ("segments", segment_stage),
+        ("artists", artist_stage),
+        ("tight_layout", lambda _: fig.tight_layout()),
+        ("draw", lambda _: canvas.draw()),
+    ])
+
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"import": elapsed, "pyplot": "matplotlib.pyplot" in sys.modules,
+                   "matplotlib": "matplotlib" in sys.modules}}))
+"""
+
+
+def bench_startup(module, repeat):
+    """Time importing an entry module in a fresh interpreter
+
+    Also reports whether the import pulled in matplotlib or pyplot, which the
+    plotters defer until their window is on screen.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT.format(module=module)],
+                                cwd=here, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output)
+        if best is None or result["import"] < best["import"]:
+            best = result
+    return best
+
+
+def run(sizes, star_sizes, repeat):
+    """Run the whole suite and return a JSON-serialisable result dict"""
+    import matplotlib
+
+    results = {}
+    for module in ENTRY_MODULES:
+        key = f"startup/{module}"
+        startup = bench_startup(module, repeat)
+        results[key] = {"import": startup["import"]}
+        print(f"{key}: import {startup['import'] * 1000:.2f} ms"
+              + (", loads pyplot" if startup["pyplot"] else "")
+              + (", loads matplotlib" if startup["matplotlib"] else ""), file=sys.stderr)
+        if startup["pyplot"]:
+            results[key]["pyplot_loaded"] = True
+    for curve_type in BENCH_CURVES:
+        for n_points in sizes:
+            key = f"{curve_type}/{n_points}"
+            results[key] = bench_curve(curve_type, n_points, repeat)
+            print(f"{key}: " + ", ".join(f"{stage} {t * 1000:.2f} ms" for stage, t in results[key].items()),
+                  file=sys.stderr)
+        key = f"{curve_type}/adaptive"
+        results[key] = bench_adaptive(curve_type, repeat)
+        print(f"{key}: evaluate {results[key]['evaluate'] * 1000:.2f} ms", file=sys.stderr)
+    for p in star_sizes:
+        key = f"star_polygon/{p}"
+        results[key] = bench_star(p, repeat)
+        print(f"{key}: " + ", ".join(f"{stage} {t * 1000:.2f} ms" for stage, t in results[key].items()),
+              file=sys.stderr)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold, min_time):
+    """Return a list of regression messages for stages slower than baseline by more than threshold
+
+    Stages faster than min_time seconds in both runs are ignored as noise.
+    """
+    regressions = []
+    for key, stages in current["results"].items():
+        if stages.get("pyplot_loaded"):
+            regressions.append(f"{key}: importing the entry module loads matplotlib.pyplot")
+        for stage, elapsed in stages.items():
+            if not isinstance(elapsed, float):
+                continue
+            before = baseline["results"].get(key, {}).get(stage)
+            if before is None or max(before, elapsed) < min_time:
+                continue
+            if elapsed > before * (1 + threshold):
+                regressions.append(f"{key} {stage}: {before * 1000:.2f} ms -> {elapsed * 1000:.2f} ms "
+                                   f"(+{(elapsed / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark curve evaluation and rendering headlessly")
+    parser.add_argument("-o", "--output", default="benchmark.json", help="Where to write the results")
+    parser.add_argument("--sizes", type=float, nargs="+", default=DEFAULT_SIZES, help="Point counts for the polar curves")
+    parser.add_argument("--star-sizes", type=float, nargs="+", default=DEFAULT_STAR_SIZES, help="p values for the star polygon")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest is kept")
+    parser.add_argument("--compare", metavar="BASELINE", help="Results file from an earlier commit to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown per stage, as a fraction")
+    parser.add_argument("--min-time", type=float, default=0.001, help="Ignore stages faster than this many seconds")
+    args = parser.parse_args()
+
+    results = run([int(n) for n in args.sizes], [int(p) for p in args.star_sizes], args.repeat)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_time)
+        for message in regressions:
+            print("REGRESSION " + message, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import tkinter as tk
 from tkinter import ttk
-import matplotlib as mpl
 
 from PlotApp import PlotApp
 
 class ButterflyPlotterApp(PlotApp):
+    SUPPORTS_GALLERY = True
+
     def __init__(self, root):
         # Initialize parameters
         self.max_theta = 24 * np.pi
@@ -65,9 +65,16 @@ class ButterflyPlotterApp(PlotApp):
         stretch_info.grid(row=5, column=0, columnspan=2, sticky="w", pady=(0, 10))
         
         # Apply button
-        apply_button = ttk.Button(params_frame, text="Apply Changes", command=self.on_apply)
+        apply_button = ttk.Button(params_frame, text="Apply Changes", command=self.apply_changes)
         apply_button.grid(row=6, column=0, columnspan=2, sticky="ew", pady=(10, 0))
         
+        # Optional live sliders
+        self.create_live_sliders(params_frame, 7, [
+            ("Frequency", self.freq_var, 0, 20, True),
+            ("Amplitude", self.amp_var, 0, 10, False),
+            ("Stretch", self.stretch_var, 1, 100, True),
+        ])
+        
         # Equation information
         equation_frame = ttk.LabelFrame(self.control_frame, text="Equation Information", padding=10)
         equation_frame.grid(row=2, column=0, pady=(0, 20), sticky="ew")
@@ -162,36 +169,29 @@ in polar coordinates."""
         if update_needed:
             self.update_plot()
 
+    def gallery_variants(self):
+        """Wing frequencies 1-10 across and wing amplitudes 0.5-5 down, at the current stretch"""
+        variants = [(f"F {frequency}, A {amplitude:g}",
+                     {"wing_frequency": frequency, "wing_amplitude": amplitude, "sine_stretch": self.sine_stretch})
+                    for amplitude in (0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5)
+                    for frequency in range(1, 11)]
+        return "butterfly", variants, 10
+
+    def load_parameters(self, params):
+        """Plot a frequency and amplitude picked in the gallery"""
+        self.wing_frequency = params["wing_frequency"]
+        self.wing_amplitude = params["wing_amplitude"]
+        self.freq_var.set(str(self.wing_frequency))
+        self.amp_var.set(str(self.wing_amplitude))
+        self.update_plot()
+
     def update_plot(self):
-        # Clear the previous plot
-        self.ax.clear()
-        
-        # Calculate theta values
-        theta = np.linspace(0, self.max_theta, self.n_points)
-        
-        # Calculate r using the butterfly curve equation with the current parameters
-        r = np.exp(np.sin(theta)) - self.wing_amplitude * np.cos(self.wing_frequency * theta) + np.power(np.sin((2 * theta - np.pi) / self.sine_stretch), 5)
-        
-        # Convert to Cartesian coordinates
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        
-        # Plot the curve
-        self.ax.plot(x, y, color='purple', linewidth=1.5)
-        
-        # Set up the axis
-        self.ax.set_title(f"Butterfly Curve\nFrequency: {self.wing_frequency}, Amplitude: {self.wing_amplitude}, Stretch: {self.sine_stretch}", fontsize=14)
-        self.ax.set_aspect('equal')
-        self.ax.grid(True, linestyle='--', alpha=0.7)
-        
-        # Get good limits based on the data
-        max_range = max(abs(np.max(x)), abs(np.min(x)), abs(np.max(y)), abs(np.min(y)))
-        self.ax.set_xlim(-max_range*1.1, max_range*1.1)
-        self.ax.set_ylim(-max_range*1.1, max_range*1.1)
-        
-        # Update the figure
-        self.fig.tight_layout()
-        self.canvas.draw()
+        # Plot the butterfly curve with the current parameters
+        params = {"wing_frequency": self.wing_frequency,
+                  "wing_amplitude": self.wing_amplitude,
+                  "sine_stretch": self.sine_stretch}
+        title = f"Butterfly Curve\nFrequency: {self.wing_frequency}, Amplitude: {self.wing_amplitude}, Stretch: {self.sine_stretch}"
+        self.plot_curve("butterfly", params, color='purple', title=title)
 
     def reset_view(self):
         """Reset the view to default"""
@@ -209,9 +209,6 @@ in polar coordinates."""
         self.update_plot()
 
 def main():
-    # Configure matplotlib to use a more modern style
-    plt.style.use('ggplot')
-    
     # Create the tkinter root window
     root = tk.Tk()
     
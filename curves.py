@@ -0,0 +1,740 @@
+from collections import OrderedDict
+import threading
+
+import numpy as np
+
+import expressionEngine
+
+
+def _broadcast(theta, *params):
+    """Lay out theta along the last axis and every parameter along the leading axes
+
+    Scalar parameters give a single curve of shape (n,). Parameter arrays of
+    shape (k,) give a batch of k curves of shape (k, n), one per parameter set.
+    """
+    theta = np.asarray(theta, dtype=float)
+    params = [np.asarray(p, dtype=float)[..., np.newaxis] for p in params]
+    return (theta,) + tuple(params)
+
+
+def theta_range(max_theta, n_points):
+    """Evenly spaced angles from 0 to max_theta"""
+    return np.linspace(0, max_theta, n_points)
+
+
+# Scratch arrays larger than this many elements are not kept between evaluations
+WORK_BUFFER_MAX_POINTS = 4_000_000
+
+# Per-thread scratch arrays for intermediate results, reused from one evaluation to the next
+_work = threading.local()
+
+
+def _work_buffer(name, shape):
+    """Return a scratch array of the given shape, reusing this thread's buffer called name"""
+    size = int(np.prod(shape))
+    if size > WORK_BUFFER_MAX_POINTS:
+        return np.empty(shape)
+    buffers = _work.__dict__.setdefault("buffers", {})
+    buffer = buffers.get(name)
+    if buffer is None or buffer.size < size:
+        buffer = buffers[name] = np.empty(size)
+    return buffer[:size].reshape(shape)
+
+
+def _batch_shape(theta, *params):
+    """Shape of r(θ) for theta and parameters laid out as by _broadcast"""
+    return np.broadcast_shapes(np.shape(theta), *(np.shape(p) + (1,) for p in params))
+
+
+def polar_to_cartesian(r, theta):
+    """Convert polar coordinates to Cartesian (x, y)"""
+    return r * np.cos(theta), r * np.sin(theta)
+
+
+def mask_non_finite(x, y):
+    """Return (x, y) with both coordinates of every infinite or NaN point set to NaN
+
+    Such points, e.g. r = 1/θ at θ = 0, become gaps in the line instead of
+    stretching extents and axis limits to infinity.
+    """
+    bad = ~(np.isfinite(x) & np.isfinite(y))
+    if bad.any():
+        x = np.where(bad, np.nan, x)
+        y = np.where(bad, np.nan, y)
+    return x, y
+
+
+# Polar curves are evaluated in blocks of about this many points so the scratch buffers stay in cache
+EVALUATE_CHUNK_POINTS = 1 << 16
+
+
+def _polar_curve(radius, theta, params, pass_sin=False):
+    """Evaluate radius(theta, *params) as Cartesian (x, y) without full-size temporaries
+
+    θ is processed in chunks: sin θ, cos θ and r are computed once per chunk
+    into per-thread scratch buffers, and only the x and y outputs are
+    allocated at full size. With pass_sin the radius function also receives
+    the chunk's sin θ.
+    """
+    theta = np.asarray(theta, dtype=float)
+    shape = _batch_shape(theta, *params)
+    x = np.empty(shape)
+    y = np.empty(shape)
+
+    if theta.ndim == 1:
+        rows = int(np.prod(shape[:-1]))
+        step = max(EVALUATE_CHUNK_POINTS // max(rows, 1), 1)
+        chunks = [(Ellipsis, slice(start, start + step)) for start in range(0, theta.size, step)]
+    else:
+        # Scalar or multi-dimensional θ is evaluated in one go
+        chunks = [Ellipsis]
+
+    for index in chunks:
+        chunk = theta[index[1]] if theta.ndim == 1 else theta
+        sin_theta = np.sin(chunk, out=_work_buffer("sin", chunk.shape))
+        cos_theta = np.cos(chunk, out=_work_buffer("cos", chunk.shape))
+        r = _work_buffer("r", _batch_shape(chunk, *params))
+        if pass_sin:
+            radius(chunk, *params, out=r, sin_theta=sin_theta)
+        else:
+            radius(chunk, *params, out=r)
+        np.multiply(r, cos_theta, out=x[index])
+        np.multiply(r, sin_theta, out=y[index])
+    return x, y
+
+
+def butterfly_radius(theta, wing_frequency, wing_amplitude, sine_stretch, out=None, sin_theta=None):
+    """Butterfly curve r = e^sin(θ) - A×cos(F×θ) + sin⁵((2θ - π)/S)
+
+    The result is written to out if given. sin_theta may pass in a
+    precomputed sin(θ).
+    """
+    theta, F, A, S = _broadcast(theta, wing_frequency, wing_amplitude, sine_stretch)
+    shape = np.broadcast_shapes(theta.shape, F.shape, A.shape, S.shape)
+    r = np.empty(shape) if out is None else out
+    tmp = _work_buffer("tmp", shape)
+    power = _work_buffer("power", shape)
+
+    # e^sin(θ)
+    np.exp(np.sin(theta) if sin_theta is None else sin_theta, out=r)
+
+    # - A×cos(F×θ)
+    np.multiply(F, theta, out=tmp)
+    np.cos(tmp, out=tmp)
+    tmp *= A
+    r -= tmp
+
+    # + sin⁵((2θ - π)/S), with the fifth power as s²×s²×s
+    np.multiply(theta, 2, out=tmp)
+    tmp -= np.pi
+    tmp /= S
+    np.sin(tmp, out=tmp)
+    np.multiply(tmp, tmp, out=power)
+    power *= power
+    power *= tmp
+    r += power
+    return r
+
+
+def spiral_sin_radius(theta, n_petals, out=None):
+    """Spiral petal r = θ × sin((n × θ) / 2)²"""
+    theta, n = _broadcast(theta, n_petals)
+    r = np.empty(np.broadcast_shapes(theta.shape, n.shape)) if out is None else out
+    np.multiply(n, theta, out=r)
+    r /= 2
+    np.sin(r, out=r)
+    r *= r
+    r *= theta
+    return r
+
+
+def spiral_cos_radius(theta, n_petals, out=None):
+    """Spiral petal r = θ × cos((n × θ) / 2)²"""
+    theta, n = _broadcast(theta, n_petals)
+    r = np.empty(np.broadcast_shapes(theta.shape, n.shape)) if out is None else out
+    np.multiply(n, theta, out=r)
+    r /= 2
+    np.cos(r, out=r)
+    r *= r
+    r *= theta
+    return r
+
+
+def _rhodonea_radius(trig, theta, n_petals, face_radius, out=None):
+    theta, n, face = _broadcast(theta, n_petals, face_radius)
+    r = np.empty(np.broadcast_shapes(theta.shape, n.shape, face.shape)) if out is None else out
+    odd = n % 2 == 1
+    # odd: trig(kθ) gives k petals; even: abs folds negative radii back, giving 2k = n petals
+    k = np.where(odd, n, n / 2)
+    np.multiply(k, theta, out=r)
+    trig(r, out=r)
+    np.abs(r, out=r, where=~odd)
+    r += face
+    return r
+
+
+def rhodonea_sin_radius(theta, n_petals, face_radius=1, out=None):
+    """Rhodonea r = sin(k × θ) + face_radius, with k chosen to give exactly n petals"""
+    return _rhodonea_radius(np.sin, theta, n_petals, face_radius, out)
+
+
+def rhodonea_cos_radius(theta, n_petals, face_radius=1, out=None):
+    """Rhodonea r = cos(k × θ) + face_radius, with k chosen to give exactly n petals"""
+    return _rhodonea_radius(np.cos, theta, n_petals, face_radius, out)
+
+
+def butterfly(theta, wing_frequency, wing_amplitude, sine_stretch):
+    """Butterfly curve as Cartesian (x, y)"""
+    return _polar_curve(butterfly_radius, theta, (wing_frequency, wing_amplitude, sine_stretch), pass_sin=True)
+
+
+def spiral_sin(theta, n_petals):
+    """Spiral petal (sin) as Cartesian (x, y)"""
+    return _polar_curve(spiral_sin_radius, theta, (n_petals,))
+
+
+def spiral_cos(theta, n_petals):
+    """Spiral petal (cos) as Cartesian (x, y)"""
+    return _polar_curve(spiral_cos_radius, theta, (n_petals,))
+
+
+def rhodonea_sin(theta, n_petals, face_radius=1):
+    """Rhodonea (sin) as Cartesian (x, y)"""
+    return _polar_curve(rhodonea_sin_radius, theta, (n_petals, face_radius))
+
+
+def rhodonea_cos(theta, n_petals, face_radius=1):
+    """Rhodonea (cos) as Cartesian (x, y)"""
+    return _polar_curve(rhodonea_cos_radius, theta, (n_petals, face_radius))
+
+
+def star_polygon_vertices(p):
+    """Return the (x, y) coordinates of p points equally spaced on the unit circle"""
+    theta = 2 * np.pi * np.arange(p) / p
+    return np.cos(theta), np.sin(theta)
+
+
+def star_polygon(p, q, stride=1):
+    """Return the (x, y) edges of the star polygon {p/q}
+
+    Each edge connects point i to point (i + q) mod p and is followed by a NaN
+    separator so the whole star can be drawn as one broken line. q may be an
+    array of steps, giving one row of edges per step. With a stride above 1
+    only every stride-th edge is kept, which still covers the star evenly.
+    """
+    x, y = star_polygon_vertices(p)
+    start = np.arange(0, p, stride)
+    q = np.asarray(q)[..., np.newaxis]
+    target = (start + q) % p
+    shape = target.shape[:-1] + (len(start), 3)
+    edges_x = np.full(shape, np.nan)
+    edges_y = np.full(shape, np.nan)
+    edges_x[..., 0] = x[start]
+    edges_y[..., 0] = y[start]
+    edges_x[..., 1] = x[target]
+    edges_y[..., 1] = y[target]
+    return edges_x.reshape(shape[:-2] + (-1,)), edges_y.reshape(shape[:-2] + (-1,))
+
+
+def star_polygon_segments(p, q):
+    """Return the edges of the star polygon {p/q} as a (p, 2, 2) array of segments
+
+    Segment i runs from point i to point (i + q) mod p, ready for a
+    LineCollection.
+    """
+    x, y = star_polygon_vertices(p)
+    target = (np.arange(p) + q) % p
+    segments = np.empty((p, 2, 2))
+    segments[:, 0, 0] = x
+    segments[:, 0, 1] = y
+    segments[:, 1, 0] = x[target]
+    segments[:, 1, 1] = y[target]
+    return segments
+
+
+# Names under which the angle is available in a polar expression
+POLAR_VARIABLES = ("theta", "θ")
+
+
+def _expression_values(theta, params):
+    """Broadcast theta and the parameter values and return them as keyword arguments"""
+    names = sorted(params)
+    theta, *values = _broadcast(theta, *(params[name] for name in names))
+    return theta, dict(zip(names, values))
+
+
+def polar_expression_radius(theta, expression, **params):
+    """User-defined r(θ), given as an expression in theta (or θ) and the parameters"""
+    function = expressionEngine.compile_expression(expression, POLAR_VARIABLES + tuple(sorted(params)))
+    theta, values = _expression_values(theta, params)
+    r = function(theta=theta, θ=theta, **values)
+    return np.broadcast_to(r, np.broadcast(theta, *values.values()).shape).astype(float, copy=False)
+
+
+def polar_expression(theta, expression, **params):
+    """User-defined polar curve as Cartesian (x, y)"""
+    return polar_to_cartesian(polar_expression_radius(theta, expression, **params), theta)
+
+
+def parametric_expression(theta, x_expression, y_expression, **params):
+    """User-defined parametric curve (x(t), y(t)), with t running over theta"""
+    variables = ("t",) + tuple(sorted(params))
+    fx = expressionEngine.compile_expression(x_expression, variables)
+    fy = expressionEngine.compile_expression(y_expression, variables)
+    t, values = _expression_values(theta, params)
+    shape = np.broadcast(t, *values.values()).shape
+    x = np.broadcast_to(fx(t=t, **values), shape).astype(float, copy=False)
+    y = np.broadcast_to(fy(t=t, **values), shape).astype(float, copy=False)
+    return x, y
+
+
+# Radius functions r(θ) by name, each called as radius(theta, **params)
+RADII = {
+    "butterfly": butterfly_radius,
+    "spiral_sin": spiral_sin_radius,
+    "spiral_cos": spiral_cos_radius,
+    "rhodonea_sin": rhodonea_sin_radius,
+    "rhodonea_cos": rhodonea_cos_radius,
+    "polar_expression": polar_expression_radius,
+}
+
+# Curves by name, each called as curve(theta, **params) and returning (x, y)
+CURVES = {
+    "butterfly": butterfly,
+    "spiral_sin": spiral_sin,
+    "spiral_cos": spiral_cos,
+    "rhodonea_sin": rhodonea_sin,
+    "rhodonea_cos": rhodonea_cos,
+    "polar_expression": polar_expression,
+    "parametric_expression": parametric_expression,
+}
+
+
+def _whole(value):
+    """value as an int if it is a scalar whole number, otherwise None"""
+    if np.ndim(value) != 0 or not np.isfinite(value) or value != int(value):
+        return None
+    return int(value)
+
+
+def period(curve_type, **params):
+    """Smallest θ span after which the curve retraces itself, or infinity if it never does
+
+    rhodonea: odd n with no face radius closes after π, because r(θ + π) =
+    -r(θ) reaches the same points; otherwise 2π. butterfly: e^sin(θ) and
+    cos(F×θ) repeat every 2π for whole F and sin⁵((2θ - π)/S) every π×S, so
+    the curve closes after π×lcm(2, S) for whole S. The spirals grow with θ
+    and never close.
+    """
+    if curve_type in ("rhodonea_sin", "rhodonea_cos"):
+        n = _whole(params["n_petals"])
+        if n is None:
+            return np.inf
+        if n % 2 == 1 and params.get("face_radius", 1) == 0:
+            return np.pi
+        return 2 * np.pi
+    if curve_type == "butterfly":
+        F = _whole(params["wing_frequency"])
+        S = _whole(params["sine_stretch"])
+        if F is None or not S:
+            return np.inf
+        return np.pi * np.lcm(2, abs(S))
+    return np.inf
+
+
+def sampling_span(curve_type, max_theta, **params):
+    """θ span actually sampled: one full period, or max_theta if that is shorter"""
+    return min(period(curve_type, **params), max_theta)
+
+
+def symmetry(curve_type, **params):
+    """Rotational symmetry of one period of the curve as (order, segment_span, step), or None
+
+    The full period is the segment θ ∈ [0, segment_span) followed by order - 1
+    copies of it, each rotated by step radians more than the previous one.
+    A whole-number rhodonea satisfies r(θ + 2π/n) = r(θ), so its 2π period
+    is n copies of a 2π/n segment. With odd n and no face radius, r(θ + π/n)
+    = -r(θ), so its π period is n copies of a π/n segment, each rotated by
+    π + π/n.
+    """
+    if curve_type in ("rhodonea_sin", "rhodonea_cos"):
+        n = _whole(params["n_petals"])
+        if n is None or n < 2:
+            return None
+        if period(curve_type, **params) == np.pi:
+            return n, np.pi / n, np.pi + np.pi / n
+        return n, 2 * np.pi / n, 2 * np.pi / n
+    return None
+
+
+def rotate_copies(x, y, order, step):
+    """Concatenate order copies of (x, y), copy j rotated by j×step, in one batched multiply"""
+    angles = step * np.arange(order)
+    rotation = np.stack([np.stack([np.cos(angles), -np.sin(angles)], axis=-1),
+                         np.stack([np.sin(angles), np.cos(angles)], axis=-1)], axis=-2)
+    # (order, 2, 2) @ (2, n) -> (order, 2, n)
+    rotated = rotation @ np.stack([x, y])
+    return rotated[:, 0].reshape(-1), rotated[:, 1].reshape(-1)
+
+
+def _evaluate_symmetric(curve, curve_type, n_points, resolution, order, segment_span, step, params):
+    """Evaluate one symmetric segment of a curve and replicate it by rotation into a full period"""
+    if resolution is None:
+        # Evenly spaced samples of the segment, excluding its end which the next copy starts with
+        count = max(int(np.ceil((n_points - 1) / order)), 1)
+        theta = segment_span * np.arange(count) / count
+        x, y = curve(theta, **params)
+    else:
+        # The segment only spans part of the curve, so take the pixel size from the curve's radius
+        probe_x, probe_y = curve(np.linspace(0, segment_span, 65), **params)
+        pixel_size = 2 * np.nanmax(np.hypot(probe_x, probe_y)) / resolution or None
+        _, x, y = adaptive_theta(curve, 0, segment_span, resolution,
+                                 initial_points=initial_samples(curve_type, segment_span, **params),
+                                 pixel_size=pixel_size, **params)
+        x, y = x[:-1], y[:-1]
+
+    x, y = rotate_copies(x, y, order, step)
+    # Close the curve back onto its first point
+    return np.append(x, x[0]), np.append(y, y[0])
+
+
+def angular_frequency(curve_type, **params):
+    """Highest angular frequency of the trigonometric terms in r(θ)
+
+    Used to seed the adaptive sampler densely enough that no oscillation
+    falls between two starting samples.
+    """
+    if curve_type == "butterfly":
+        return max(1.0, abs(params["wing_frequency"]))
+    if curve_type == "polar_expression":
+        return expressionEngine.frequency_hint(params["expression"], params=_numeric(params))
+    if curve_type == "parametric_expression":
+        return expressionEngine.frequency_hint(params["x_expression"], params["y_expression"],
+                                               params=_numeric(params))
+    if curve_type in CURVES:
+        return max(1.0, abs(params["n_petals"]))
+    return 1.0
+
+
+def _numeric(params):
+    return {key: value for key, value in params.items() if not isinstance(value, str)}
+
+
+# Limits for the adaptive sampler
+ADAPTIVE_SAMPLES_PER_CYCLE = 8
+ADAPTIVE_MAX_POINTS = 1_000_000
+ADAPTIVE_MAX_TURN = 0.2  # radians between consecutive segments
+
+
+def initial_samples(curve_type, theta_span, **params):
+    """Number of starting samples needed to resolve every oscillation over theta_span"""
+    cycles = theta_span / (2 * np.pi) * angular_frequency(curve_type, **params)
+    return max(int(np.ceil(cycles * ADAPTIVE_SAMPLES_PER_CYCLE)) + 1, 65)
+
+
+def adaptive_theta(curve, theta_start, theta_end, resolution=None, pixel_tolerance=0.5,
+                   initial_points=65, max_points=ADAPTIVE_MAX_POINTS, max_depth=20,
+                   pixel_size=None, **params):
+    """Sample curve(theta, **params) adaptively over [theta_start, theta_end]
+
+    Intervals are bisected while the curve midpoint is further than
+    pixel_tolerance pixels from the chord, or while the curve turns sharply
+    across an interval that is still longer than a pixel. One pixel is the
+    curve's extent divided by resolution, unless pixel_size gives it in data
+    units directly. Returns (theta, x, y).
+    """
+    theta = np.linspace(theta_start, theta_end, initial_points)
+    x, y = mask_non_finite(*curve(theta, **params))
+
+    if pixel_size is not None:
+        pixel = pixel_size
+    else:
+        extent = max(np.nanmax(x) - np.nanmin(x), np.nanmax(y) - np.nanmin(y)) if np.isfinite(x).any() else 0.0
+        pixel = extent / resolution if extent > 0 else 1.0
+    tolerance = pixel_tolerance * pixel
+
+    active = np.ones(theta.size - 1, dtype=bool)
+    for _ in range(max_depth):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+
+        # Evaluate the midpoints of the intervals still being refined
+        theta_mid = 0.5 * (theta[idx] + theta[idx + 1])
+        x_mid, y_mid = mask_non_finite(*curve(theta_mid, **params))
+
+        # Chord error: distance from the curve midpoint to the chord midpoint
+        error = np.hypot(x_mid - 0.5 * (x[idx] + x[idx + 1]), y_mid - 0.5 * (y[idx] + y[idx + 1]))
+
+        # Curvature: turn angle between the two halves of the interval
+        ax, ay = x_mid - x[idx], y_mid - y[idx]
+        bx, by = x[idx + 1] - x_mid, y[idx + 1] - y_mid
+        turn = np.abs(np.arctan2(ax * by - ay * bx, ax * bx + ay * by))
+        chord = np.hypot(x[idx + 1] - x[idx], y[idx + 1] - y[idx])
+
+        refine = (error > tolerance) | ((turn > ADAPTIVE_MAX_TURN) & (chord > pixel))
+
+        # Stay within the point budget, refining the worst intervals first
+        budget = max_points - theta.size
+        if np.count_nonzero(refine) > budget:
+            worst = np.argsort(np.where(refine, error, -1))[::-1][:max(budget, 0)]
+            refine = np.zeros_like(refine)
+            refine[worst] = True
+        if not refine.any():
+            break
+
+        split = idx[refine]
+        theta = np.insert(theta, split + 1, theta_mid[refine])
+        x = np.insert(x, split + 1, x_mid[refine])
+        y = np.insert(y, split + 1, y_mid[refine])
+
+        # Both halves of every split interval are checked again on the next pass
+        first_half = split + np.arange(split.size)
+        active = np.zeros(theta.size - 1, dtype=bool)
+        active[first_half] = True
+        active[first_half + 1] = True
+
+    return theta, x, y
+
+
+class CurveCache:
+    """Bounded LRU cache of computed curve geometry, sized in bytes
+
+    The cache is shared with the plotters' worker threads, so every access
+    holds a lock.
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    @staticmethod
+    def make_key(curve_type, n_points, max_theta, params, resolution=None):
+        """Build a hashable key from the curve type, its parameters and the sampling"""
+        return (curve_type, tuple(sorted(params.items())), n_points, float(max_theta), resolution)
+
+    def get(self, key):
+        """Return the cached (x, y) for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, x, y):
+        """Store (x, y) under key, evicting least recently used entries to fit"""
+        size = x.nbytes + y.nbytes
+        if size > self._max_bytes:
+            return
+        # Cached arrays are shared between callers, so guard them against mutation
+        x.flags.writeable = False
+        y.flags.writeable = False
+        with self._lock:
+            if key in self._entries:
+                old_x, old_y = self._entries.pop(key)
+                self.current_bytes -= old_x.nbytes + old_y.nbytes
+            self._entries[key] = (x, y)
+            self.current_bytes += size
+            self._evict()
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self):
+        while self.current_bytes > self._max_bytes and self._entries:
+            old_x, old_y = self._entries.popitem(last=False)[1]
+            self.current_bytes -= old_x.nbytes + old_y.nbytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        # Unlike get(), a membership test neither counts as a hit or miss nor refreshes the entry
+        with self._lock:
+            return key in self._entries
+
+
+# Shared geometry cache used by evaluate()
+cache = CurveCache()
+
+# Optional persistent cache behind the in-memory one (a diskCache.DiskCache), off by default
+disk_cache = None
+
+
+def evaluate(curve_type, n_points, max_theta, use_cache=True, resolution=None, **params):
+    """Evaluate a named curve over [0, max_theta] and return its (x, y) arrays
+
+    Only the first period of a closed curve is sampled (see period()), and
+    for curves with rotational symmetry only one segment of it (see
+    symmetry()).
+    With resolution=None the curve is sampled at n_points evenly spaced
+    angles. Otherwise it is sampled adaptively so that the polyline stays
+    within half a pixel of the true curve when its extent spans resolution
+    pixels, and n_points is ignored.
+
+    Results are kept in the shared LRU cache, so revisiting a previous
+    configuration returns the stored arrays without re-evaluating the curve.
+    When disk_cache is set, memory misses are looked up there and computed
+    curves are written to it, so they survive a restart.
+    """
+    if use_cache:
+        key = CurveCache.make_key(curve_type, n_points, max_theta, params, resolution)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        if disk_cache is not None:
+            stored = disk_cache.get_points(key)
+            if stored is not None:
+                cache.put(key, *stored)
+                return stored
+
+    # Samples beyond one period would only retrace the curve
+    curve = CURVES[curve_type]
+    span = sampling_span(curve_type, max_theta, **params)
+    symmetric = symmetry(curve_type, **params) if span == period(curve_type, **params) else None
+    if symmetric is not None:
+        # Only one symmetric segment needs the trigonometry; the rest is rotated copies
+        x, y = _evaluate_symmetric(curve, curve_type, n_points, resolution, *symmetric, params)
+    elif resolution is None:
+        theta = theta_range(span, n_points)
+        x, y = mask_non_finite(*curve(theta, **params))
+    else:
+        _, x, y = adaptive_theta(curve, 0, span, resolution,
+                                 initial_points=initial_samples(curve_type, span, **params), **params)
+
+    if use_cache:
+        cache.put(key, x, y)
+        if disk_cache is not None:
+            disk_cache.put_points(key, x, y)
+    return x, y
+
+
+def evaluate_batch(curve_type, n_points, max_theta, variants):
+    """Evaluate one curve type for several parameter dicts in a single vectorised call
+
+    Every variant is sampled at the same n_points angles, spanning the
+    longest sampling_span() among them, so variants with a shorter period
+    are simply retraced. Returns (x, y) of shape (len(variants), n_points).
+    """
+    span = max(sampling_span(curve_type, max_theta, **params) for params in variants)
+    batched = {name: np.array([params[name] for params in variants], dtype=float) for name in variants[0]}
+    return CURVES[curve_type](theta_range(span, n_points), **batched)
+
+
+# Bytes of geometry one prefetch() call may add to the cache
+PREFETCH_MAX_BYTES = 16 * 1024 * 1024
+
+
+def prefetch(candidates, n_points, max_theta, resolution=None, max_bytes=PREFETCH_MAX_BYTES, cancel=None):
+    """Evaluate (curve_type, params) candidates in order into the shared cache
+
+    Meant for a worker thread: stops early once the newly cached arrays
+    reach max_bytes or the threading.Event cancel is set, which is checked
+    before every candidate. Candidates already in the memory cache are
+    skipped. Returns the number of curves added.
+    """
+    added = 0
+    added_bytes = 0
+    for curve_type, params in candidates:
+        if (cancel is not None and cancel.is_set()) or added_bytes >= max_bytes:
+            break
+        if CurveCache.make_key(curve_type, n_points, max_theta, params, resolution) in cache:
+            continue
+        x, y = evaluate(curve_type, n_points, max_theta, resolution=resolution, **params)
+        added += 1
+        added_bytes += x.nbytes + y.nbytes
+    return added
+
+
+# Points per chunk when streaming a curve
+STREAM_CHUNK_POINTS = 1_000_000
+
+
+def iter_chunks(curve_type, n_points, max_theta, chunk_size=STREAM_CHUNK_POINTS, **params):
+    """Yield a uniformly sampled curve as successive (x, y) chunks of at most chunk_size points
+
+    The angles are the n_points evenly spaced samples of one period (see
+    sampling_span), but only one chunk of them exists at a time, so memory
+    use is bounded by chunk_size however long the curve is. Consecutive
+    chunks do not overlap.
+    """
+    curve = CURVES[curve_type]
+    step = sampling_span(curve_type, max_theta, **params) / max(n_points - 1, 1)
+    for start in range(0, n_points, chunk_size):
+        theta = np.arange(start, min(start + chunk_size, n_points), dtype=float)
+        theta *= step
+        yield curve(theta, **params)
+
+
+# Point budget for one viewport re-evaluation
+VIEWPORT_MAX_POINTS = 200_000
+
+
+def visible_theta_ranges(curve_type, max_theta, xlim, ylim, **params):
+    """Return the θ intervals of [0, max_theta] whose part of the curve may fall inside the view
+
+    The curve is probed on a coarse grid and every probe segment whose
+    bounding box, padded by its own length, overlaps the view is kept.
+    Adjacent kept segments are merged into (start, end) ranges.
+    """
+    curve = CURVES[curve_type]
+    theta = np.linspace(0, max_theta, 4 * initial_samples(curve_type, max_theta, **params))
+    x, y = curve(theta, **params)
+
+    pad = np.hypot(np.diff(x), np.diff(y))
+    seg_xmin = np.minimum(x[:-1], x[1:]) - pad
+    seg_xmax = np.maximum(x[:-1], x[1:]) + pad
+    seg_ymin = np.minimum(y[:-1], y[1:]) - pad
+    seg_ymax = np.maximum(y[:-1], y[1:]) + pad
+    visible = ((seg_xmax >= xlim[0]) & (seg_xmin <= xlim[1]) &
+               (seg_ymax >= ylim[0]) & (seg_ymin <= ylim[1]))
+
+    # Turn runs of visible segments into θ ranges
+    edges = np.diff(np.concatenate(([0], visible.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [(theta[s], theta[e]) for s, e in zip(starts, ends)]
+
+
+def evaluate_viewport(curve_type, max_theta, xlim, ylim, width_px, **params):
+    """Evaluate only the parts of a curve inside the view, at the view's pixel resolution
+
+    Returns (x, y) with NaN breaks between disjoint visible ranges.
+    """
+    curve = CURVES[curve_type]
+    pixel_size = (xlim[1] - xlim[0]) / width_px
+    ranges = visible_theta_ranges(curve_type, sampling_span(curve_type, max_theta, **params), xlim, ylim, **params)
+    if not ranges:
+        return np.array([]), np.array([])
+
+    total_span = sum(end - start for start, end in ranges)
+    pieces_x, pieces_y = [], []
+    for start, end in ranges:
+        budget = max(int(VIEWPORT_MAX_POINTS * (end - start) / total_span), 65)
+        _, x, y = adaptive_theta(curve, start, end, pixel_size=pixel_size,
+                                 initial_points=initial_samples(curve_type, end - start, **params),
+                                 max_points=budget, **params)
+        pieces_x += [x, [np.nan]]
+        pieces_y += [y, [np.nan]]
+    return np.concatenate(pieces_x[:-1]), np.concatenate(pieces_y[:-1])
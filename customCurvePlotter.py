@@ -0,0 +1,209 @@
+import numpy as np
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from PlotApp import PlotApp
+import curves
+import expressionEngine
+
+class CustomCurvePlotterApp(PlotApp):
+    # Angles an expression is tried on before it is accepted
+    TRIAL_POINTS = 16
+
+    def __init__(self, root):
+        # Initialize parameters
+        self.max_theta = 24 * np.pi
+        self.n_points = 5000
+
+        # Default curve: the butterfly, written as an expression
+        self.mode = "polar"
+        self.expression = "exp(sin(θ)) - a*cos(4*θ) + sin((2*θ - pi)/24)**5"
+        self.x_expression = "sin(a*t)"
+        self.y_expression = "sin(b*t)"
+        self.params = {"a": 2.0, "b": 3.0}
+
+        # Initialize the base class
+        super().__init__(root, "Custom Curve Plotter")
+
+    def create_control_panel(self):
+        """Create the content for the scrollable control panel"""
+        # Title
+        title_label = ttk.Label(self.control_frame, text="Custom Curve Plotter", font=("Arial", 16, "bold"))
+        title_label.grid(row=0, column=0, pady=(0, 20), sticky="w")
+
+        # Curve type selection
+        mode_frame = ttk.LabelFrame(self.control_frame, text="Curve Type", padding=10)
+        mode_frame.grid(row=1, column=0, pady=(0, 20), sticky="ew")
+
+        self.mode_var = tk.StringVar(value=self.mode)
+        ttk.Radiobutton(mode_frame, text="Polar r(θ)", variable=self.mode_var, value="polar",
+                        command=self.on_mode_change).grid(row=0, column=0, sticky="w", pady=(0, 5))
+        ttk.Radiobutton(mode_frame, text="Parametric x(t), y(t)", variable=self.mode_var, value="parametric",
+                        command=self.on_mode_change).grid(row=1, column=0, sticky="w", pady=(0, 5))
+
+        # Expressions frame
+        params_frame = ttk.LabelFrame(self.control_frame, text="Curve Definition", padding=10)
+        params_frame.grid(row=2, column=0, pady=(0, 20), sticky="ew")
+        params_frame.columnconfigure(1, weight=1)
+
+        # Polar expression
+        self.polar_frame = ttk.Frame(params_frame)
+        self.polar_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
+        self.polar_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(self.polar_frame, text="r(θ) =").grid(row=0, column=0, sticky="w", pady=(0, 5))
+        self.expression_var = tk.StringVar(value=self.expression)
+        ttk.Entry(self.polar_frame, textvariable=self.expression_var, width=40).grid(row=0, column=1, padx=(10, 0), sticky="ew", pady=(0, 5))
+
+        # Parametric expressions (initially created but hidden)
+        self.parametric_frame = ttk.Frame(params_frame)
+        self.parametric_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(self.parametric_frame, text="x(t) =").grid(row=0, column=0, sticky="w", pady=(0, 5))
+        self.x_expression_var = tk.StringVar(value=self.x_expression)
+        ttk.Entry(self.parametric_frame, textvariable=self.x_expression_var, width=40).grid(row=0, column=1, padx=(10, 0), sticky="ew", pady=(0, 5))
+
+        ttk.Label(self.parametric_frame, text="y(t) =").grid(row=1, column=0, sticky="w", pady=(0, 5))
+        self.y_expression_var = tk.StringVar(value=self.y_expression)
+        ttk.Entry(self.parametric_frame, textvariable=self.y_expression_var, width=40).grid(row=1, column=1, padx=(10, 0), sticky="ew", pady=(0, 5))
+
+        # Parameters
+        ttk.Label(params_frame, text="Parameters:").grid(row=1, column=0, sticky="w", pady=(10, 5))
+        self.params_var = tk.StringVar(value=", ".join(f"{name}={value:g}" for name, value in self.params.items()))
+        ttk.Entry(params_frame, textvariable=self.params_var, width=30).grid(row=1, column=1, padx=(10, 0), sticky="ew", pady=(10, 5))
+
+        params_info = ttk.Label(params_frame, text="(e.g. a=2, b=3)")
+        params_info.grid(row=2, column=0, columnspan=2, sticky="w", pady=(0, 10))
+
+        # Range of the angle / curve parameter, in multiples of pi
+        ttk.Label(params_frame, text="Range (× π):").grid(row=3, column=0, sticky="w", pady=(0, 5))
+        self.range_var = tk.StringVar(value=f"{self.max_theta / np.pi:g}")
+        ttk.Entry(params_frame, textvariable=self.range_var, width=10).grid(row=3, column=1, padx=(10, 0), sticky="e", pady=(0, 5))
+
+        # Apply button
+        apply_button = ttk.Button(params_frame, text="Apply Changes", command=self.apply_changes)
+        apply_button.grid(row=4, column=0, columnspan=2, sticky="ew", pady=(10, 0))
+
+        # Syntax information
+        syntax_frame = ttk.LabelFrame(self.control_frame, text="Expression Syntax", padding=10)
+        syntax_frame.grid(row=3, column=0, pady=(0, 20), sticky="ew")
+
+        syntax_text = """Operators: + - * / ** % and comparisons
+Variables: θ or theta (polar), t (parametric)
+Constants: pi, e, tau
+Functions: sin, cos, tan, exp, log, sqrt, abs,
+  arcsin, arccos, arctan, sinh, cosh, tanh,
+  floor, ceil, sign, min, max, where
+
+Example: r(θ) = cos(a*θ) + b"""
+
+        syntax_label = ttk.Label(syntax_frame, text=syntax_text, justify="left")
+        syntax_label.grid(row=0, column=0, sticky="w")
+
+        # Instructions
+        instructions_frame = ttk.LabelFrame(self.control_frame, text="Instructions", padding=10)
+        instructions_frame.grid(row=4, column=0, pady=(0, 20), sticky="ew")
+
+        instructions_text = """• Enter an expression and its parameters
+• Hold Ctrl + Mouse Scroll to zoom in/out
+• Right-click and drag to pan the view
+• Use toolbar buttons for additional controls
+• Double-click on the plot to reset the view"""
+
+        instructions_label = ttk.Label(instructions_frame, text=instructions_text, justify="left")
+        instructions_label.grid(row=0, column=0, sticky="w")
+
+        # Reset Button
+        reset_button = ttk.Button(self.control_frame, text="Reset View", command=self.reset_view)
+        reset_button.grid(row=5, column=0, pady=(0, 20), sticky="ew")
+
+    def on_mode_change(self):
+        """Show the expression inputs for the selected curve type"""
+        if self.mode_var.get() == "polar":
+            self.parametric_frame.grid_forget()
+            self.polar_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
+        else:
+            self.polar_frame.grid_forget()
+            self.parametric_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
+
+    def on_apply(self):
+        """Handle apply button click - validate the expressions and update plot"""
+        mode = self.mode_var.get()
+        try:
+            params = expressionEngine.parse_parameters(self.params_var.get())
+            # Compile now so errors are reported here; the compiled function is cached for the worker
+            if mode == "polar":
+                expressionEngine.compile_expression(self.expression_var.get(), curves.POLAR_VARIABLES + tuple(sorted(params)))
+            else:
+                variables = ("t",) + tuple(sorted(params))
+                expressionEngine.compile_expression(self.x_expression_var.get(), variables)
+                expressionEngine.compile_expression(self.y_expression_var.get(), variables)
+        except expressionEngine.ExpressionError as e:
+            messagebox.showerror("Invalid Expression", str(e))
+            return
+
+        # Valid syntax can still fail to run, e.g. sin(theta, 2), so try it on a few angles first
+        if mode == "polar":
+            trial_params = dict(params, expression=self.expression_var.get())
+        else:
+            trial_params = dict(params, x_expression=self.x_expression_var.get(),
+                                y_expression=self.y_expression_var.get())
+        try:
+            with np.errstate(all='ignore'):
+                curves.CURVES[f"{mode}_expression"](np.linspace(0, 2 * np.pi, self.TRIAL_POINTS), **trial_params)
+        except Exception as e:
+            messagebox.showerror("Invalid Expression", f"The expression cannot be evaluated: {e}")
+            return
+
+        # Validate the range
+        try:
+            range_value = float(self.range_var.get())
+            if range_value <= 0:
+                messagebox.showerror("Invalid Input", "Range must be positive")
+                return
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Range must be a number")
+            return
+
+        # Update parameters and plot
+        self.mode = mode
+        self.expression = self.expression_var.get()
+        self.x_expression = self.x_expression_var.get()
+        self.y_expression = self.y_expression_var.get()
+        self.params = params
+        self.max_theta = range_value * np.pi
+        self.update_plot()
+
+    def on_compute_error(self, slot, error):
+        """Report an expression that failed on the full range of angles"""
+        super().on_compute_error(slot, error)
+        messagebox.showerror("Evaluation Error", f"The curve could not be evaluated: {error}")
+
+    def update_plot(self):
+        """Plot the user-defined curve with the current parameters"""
+        param_info = ", ".join(f"{name}: {value:g}" for name, value in self.params.items())
+        if self.mode == "polar":
+            params = dict(self.params, expression=self.expression)
+            title = f"r(θ) = {self.expression}\n{param_info}"
+            self.plot_curve("polar_expression", params, color='teal', title=title)
+        else:
+            params = dict(self.params, x_expression=self.x_expression, y_expression=self.y_expression)
+            title = f"x(t) = {self.x_expression}, y(t) = {self.y_expression}\n{param_info}"
+            self.plot_curve("parametric_expression", params, color='darkorange', title=title)
+
+    def reset_view(self):
+        """Reset the view to default"""
+        self.update_plot()
+
+def main():
+    # Create the tkinter root window
+    root = tk.Tk()
+
+    # Create and run the app
+    app = CustomCurvePlotterApp(root)
+
+    # Start the main loop
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
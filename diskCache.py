@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+# Bump when the sampling changes so stale entries are never returned
+CACHE_VERSION = 1
+
+
+class DiskCache:
+    """Size-bounded cache of curve points (.npy) and rendered rasters (.png) in a directory
+
+    Entries are named by the SHA-256 of their key and written to a temporary
+    file first, then moved into place with os.replace, so readers in other
+    processes only ever see complete files. Reading an entry refreshes its
+    modification time, and eviction removes the least recently used files
+    until the directory fits in max_bytes. Eviction runs under a lock file
+    shared by every process using the directory.
+    """
+    # A lock file older than this is assumed to belong to a crashed process
+    LOCK_TIMEOUT = 10.0
+    # Temporary files older than this were abandoned by a process that died mid-write
+    STALE_TMP_SECONDS = 3600
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock_path = os.path.join(directory, ".lock")
+
+    @staticmethod
+    def hash_key(key):
+        """Stable hex digest of a JSON-serialisable key"""
+        text = json.dumps([CACHE_VERSION, key], default=float, sort_keys=True)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, self.hash_key(key) + suffix)
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def get_points(self, key):
+        """Return the cached (x, y) for key, or None on a miss"""
+        path = self._path(key, ".npy")
+        try:
+            points = np.load(path)
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return points[0], points[1]
+
+    def put_points(self, key, x, y):
+        """Store (x, y) under key"""
+        return self._write(self._path(key, ".npy"), lambda f: np.save(f, np.stack([x, y])))
+
+    def get_raster(self, key):
+        """Return the cached RGBA raster for key as a uint8 array, or None on a miss"""
+        import matplotlib.image
+
+        path = self._path(key, ".png")
+        try:
+            raster = matplotlib.image.imread(path)
+        except (OSError, ValueError, SyntaxError):
+            return None
+        self._touch(path)
+        return (raster * 255).astype(np.uint8) if raster.dtype != np.uint8 else raster
+
+    def put_raster(self, key, rgba):
+        """Store an RGBA uint8 raster under key as PNG"""
+        import matplotlib.image
+
+        return self._write(self._path(key, ".png"), lambda f: matplotlib.image.imsave(f, rgba, format="png"))
+
+    def _write(self, path, write):
+        """Write a file atomically, then evict old entries if the directory is over budget
+
+        A failed write, e.g. on a full disk, leaves the cache as it was;
+        returns whether the entry was stored.
+        """
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return False
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException as error:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            if isinstance(error, OSError):
+                return False
+            raise
+        self.evict()
+        return True
+
+    def _acquire(self):
+        """Take the directory lock, breaking it if its holder seems to have died"""
+        while True:
+            try:
+                fd = os.open(self._lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.close(fd)
+                return
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self._lock_path) > self.LOCK_TIMEOUT:
+                        os.remove(self._lock_path)
+                        continue
+                except OSError:
+                    continue
+                time.sleep(0.01)
+
+    def _release(self):
+        try:
+            os.remove(self._lock_path)
+        except OSError:
+            pass
+
+    def entries(self):
+        """(mtime, size, path) of every cache file, oldest first"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith((".npy", ".png")):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def size(self):
+        """Total bytes of cached files"""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Remove least recently used files until the cache fits in max_bytes
+
+        Temporary files left behind by a process that died mid-write are
+        removed as well.
+        """
+        self._acquire()
+        try:
+            now = time.time()
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".tmp"):
+                    try:
+                        if now - entry.stat().st_mtime > self.STALE_TMP_SECONDS:
+                            os.remove(entry.path)
+                    except OSError:
+                        pass
+
+            entries = self.entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                total -= size
+        finally:
+            self._release()
+
+    def clear(self):
+        """Remove every cached file"""
+        self._acquire()
+        try:
+            for _, _, path in self.entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        finally:
+            self._release()
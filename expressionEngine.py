@@ -0,0 +1,139 @@
+import ast
+from functools import lru_cache
+
+import numpy as np
+
+# Functions an expression may call, mapped to their vectorized NumPy implementation
+FUNCTIONS = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "arcsin": np.arcsin, "arccos": np.arccos, "arctan": np.arctan, "arctan2": np.arctan2,
+    "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan, "atan2": np.arctan2,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "exp": np.exp, "log": np.log, "log10": np.log10, "sqrt": np.sqrt,
+    "abs": np.abs, "sign": np.sign, "floor": np.floor, "ceil": np.ceil,
+    "min": np.minimum, "max": np.maximum, "where": np.where,
+}
+
+# Named constants
+CONSTANTS = {"pi": np.pi, "π": np.pi, "e": np.e, "tau": 2 * np.pi}
+
+# Syntax accepted in an expression; anything else is rejected before compiling
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant, ast.Compare,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv, ast.USub, ast.UAdd,
+    ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+# Names a parameter cannot have: the curve variables, and the arguments that
+# curves.evaluate, evaluate_viewport and the expression curves take alongside the parameters
+RESERVED_NAMES = frozenset({
+    "theta", "θ", "t",
+    "curve_type", "n_points", "max_theta", "use_cache", "resolution",
+    "xlim", "ylim", "width_px", "chunk_size",
+    "expression", "x_expression", "y_expression",
+})
+
+# Largest numeric literal that still counts towards the frequency estimate
+_MAX_FREQUENCY = 1000.0
+
+
+class ExpressionError(ValueError):
+    """Raised for expressions that do not parse or use names or syntax outside the whitelist"""
+
+
+def _validate(tree, variables):
+    """Check every node of tree against the whitelist and return the names it uses
+
+    Numeric literals are turned into floats in place: Python int arithmetic
+    is unbounded, so e.g. 9**9**9 would run for ever while holding the GIL,
+    whereas float arithmetic overflows at once.
+    """
+    names = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ExpressionError(f"'{type(node).__name__}' is not allowed in an expression")
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise ExpressionError(f"Only numbers are allowed as constants, not {node.value!r}")
+            try:
+                node.value = float(node.value)
+            except OverflowError:
+                raise ExpressionError("A number in the expression is too large") from None
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+                raise ExpressionError("Only the functions " + ", ".join(sorted(FUNCTIONS)) + " can be called")
+            if node.keywords:
+                raise ExpressionError("Keyword arguments are not allowed")
+        if isinstance(node, ast.Compare) and len(node.ops) != 1:
+            raise ExpressionError("Chained comparisons are not allowed")
+        if isinstance(node, ast.Name) and node.id not in FUNCTIONS:
+            names.add(node.id)
+
+    unknown = names - set(variables) - set(CONSTANTS)
+    if unknown:
+        raise ExpressionError("Unknown name(s): " + ", ".join(sorted(unknown)))
+    return names
+
+
+@lru_cache(maxsize=256)
+def compile_expression(text, variables):
+    """Parse text and compile it into a vectorized function of the given variable names
+
+    variables is a tuple of names; the returned function takes them as
+    keyword arguments (arrays or scalars) and evaluates the expression with
+    NumPy. Results are cached by expression text, so re-evaluating with new
+    values never parses again. Raises ExpressionError for invalid input.
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid expression: {e.msg}") from None
+    _validate(tree, variables)
+
+    code = compile(tree, "<expression>", "eval")
+    namespace = dict(FUNCTIONS, **CONSTANTS)
+
+    def function(**values):
+        return eval(code, {"__builtins__": {}}, dict(namespace, **values))
+    function.text = text
+    return function
+
+
+def parse_parameters(text):
+    """Parse "a=1, b=2.5" into {"a": 1.0, "b": 2.5}"""
+    params = {}
+    for item in text.replace(";", ",").split(","):
+        if not item.strip():
+            continue
+        name, sep, value = item.partition("=")
+        name = name.strip()
+        if not sep or not name.isidentifier():
+            raise ExpressionError(f"Expected name=value, got '{item.strip()}'")
+        if name in FUNCTIONS or name in CONSTANTS:
+            raise ExpressionError(f"'{name}' is a built-in name and cannot be a parameter")
+        if name in RESERVED_NAMES:
+            raise ExpressionError(f"'{name}' is reserved and cannot be a parameter")
+        try:
+            params[name] = float(value)
+        except ValueError:
+            raise ExpressionError(f"Parameter '{name}' needs a numeric value") from None
+    return params
+
+
+@lru_cache(maxsize=256)
+def _largest_literal(text):
+    """Largest absolute numeric literal in an expression, parsed once per text"""
+    values = [abs(node.value) for node in ast.walk(ast.parse(text.strip(), mode="eval"))
+              if isinstance(node, ast.Constant) and isinstance(node.value, (int, float))]
+    return max(values, default=0.0)
+
+
+def frequency_hint(*texts, params=None):
+    """Rough upper bound on the angular frequency of the expressions
+
+    Taken as the largest number appearing as a literal or parameter value,
+    which is enough to seed the adaptive sampler for terms such as sin(k×θ).
+    """
+    values = [abs(v) for v in (params or {}).values()]
+    values += [_largest_literal(text) for text in texts]
+    return min(max([1.0] + values), _MAX_FREQUENCY)
@@ -0,0 +1,135 @@
+import tkinter as tk
+from tkinter import ttk
+
+import numpy as np
+
+from levelOfDetail import decimate
+
+# Fraction of each cell's width left empty on either side of its curve
+CELL_MARGIN = 0.08
+# Initial size of one cell on screen, in pixels
+CELL_PX = 100
+# Largest initial width or height of the grid, in pixels; cells shrink to fit
+MAX_GRID_PX = 1000
+
+
+def grid_layout(x, y, columns):
+    """Place row i of (x, y) in cell i of a grid columns wide, counted from the top left
+
+    Each cell is a unit square in a coordinate system where the grid spans
+    (0, columns) × (0, rows), and each curve is centred in its cell and
+    scaled to fit by its own extent. Returns the moved (x, y) arrays.
+    """
+    rows = -(-len(x) // columns)
+    extent = np.maximum(np.nanmax(np.abs(x), axis=1), np.nanmax(np.abs(y), axis=1))
+    scale = (0.5 - CELL_MARGIN) / np.where(extent > 0, extent, 1)
+    index = np.arange(len(x))
+    center_x = index % columns + 0.5
+    center_y = rows - index // columns - 0.5
+    return (x * scale[:, np.newaxis] + center_x[:, np.newaxis],
+            y * scale[:, np.newaxis] + center_y[:, np.newaxis])
+
+
+def cell_lines(grid_x, grid_y, columns, cell_px):
+    """Decimate every cell's curve to a cell of cell_px pixels, as a list of (n, 2) arrays for a LineCollection"""
+    rows = -(-len(grid_x) // columns)
+    lines = []
+    for i in range(len(grid_x)):
+        left, bottom = i % columns, rows - i // columns - 1
+        x, y = decimate(grid_x[i], grid_y[i], (left, left + 1), (bottom, bottom + 1), cell_px, cell_px)
+        lines.append(np.column_stack((x, y)))
+    return lines
+
+
+class GalleryWindow:
+    """A window showing a grid of parameter variants of a plotter's curve
+
+    The variants come from app.gallery_variants() and are evaluated in one
+    batch by app.gallery_curves(). All cells are drawn by one LineCollection
+    in one axes. The label of the cell under the mouse is shown below the
+    grid rather than drawn, since a hundred text artists would cost as much
+    to draw as the curves. Clicking a cell loads its parameters into the
+    main view.
+    """
+    def __init__(self, app):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Gallery")
+
+        # One axes without decorations covering the whole figure
+        self.fig = Figure(dpi=100)
+        self.ax = self.fig.add_axes((0, 0, 1, 1))
+        self.ax.set_axis_off()
+        self.ax.set_aspect('equal')
+        self.lines = LineCollection([], linewidths=1)
+        self.ax.add_collection(self.lines)
+
+        self.load_variants()
+        cell_px = min(CELL_PX, MAX_GRID_PX / max(self.columns, self.rows))
+        self.fig.set_size_inches(self.columns * cell_px / self.fig.dpi, self.rows * cell_px / self.fig.dpi)
+        self.canvas = FigureCanvasTkAgg(self.fig, self.window)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.label_var = tk.StringVar(value="")
+        ttk.Label(self.window, textvariable=self.label_var).pack(fill="x", padx=5, pady=2)
+        self.canvas.mpl_connect('motion_notify_event', self.on_motion)
+        self.canvas.mpl_connect('button_press_event', self.on_click)
+        self.canvas.mpl_connect('resize_event', self.on_resize)
+        self.update_lines()
+
+    def load_variants(self):
+        """Evaluate the app's current variants and lay them out"""
+        curve_type, self.variants, self.columns = self.app.gallery_variants()
+        self.rows = -(-len(self.variants) // self.columns)
+        x, y = self.app.gallery_curves(curve_type, self.variants)
+        self.grid_x, self.grid_y = grid_layout(x, y, self.columns)
+        self.lines.set_color(self.app.gallery_color())
+        self.ax.set_xlim(0, self.columns)
+        self.ax.set_ylim(0, self.rows)
+
+    def update_lines(self):
+        """Match the decimation of the cell curves to the current cell size in pixels"""
+        # The axes keeps square cells, so the tighter of the two directions sets their size
+        bbox = self.fig.bbox
+        cell_px = max(int(min(bbox.width / self.columns, bbox.height / self.rows)), 1)
+        self.lines.set_segments(cell_lines(self.grid_x, self.grid_y, self.columns, cell_px))
+
+    def refresh(self):
+        """Rebuild the grid from the app's current parameters and bring the window to the front"""
+        self.load_variants()
+        self.update_lines()
+        self.canvas.draw_idle()
+        self.window.lift()
+
+    def exists(self):
+        """Whether the window is still open"""
+        return bool(self.window.winfo_exists())
+
+    def on_resize(self, event):
+        """Re-decimate the curves for the new cell size"""
+        self.update_lines()
+
+    def cell_at(self, event):
+        """Index of the variant under a mouse event, or None"""
+        if event.inaxes is not self.ax or event.xdata is None:
+            return None
+        column = int(event.xdata)
+        row = int(self.rows - event.ydata)
+        index = row * self.columns + column
+        if 0 <= column < self.columns and 0 <= index < len(self.variants):
+            return index
+        return None
+
+    def on_motion(self, event):
+        """Show the label of the cell under the mouse"""
+        index = self.cell_at(event)
+        self.label_var.set(self.variants[index][0] if index is not None else "")
+
+    def on_click(self, event):
+        """Load the parameters of the clicked cell into the app"""
+        index = self.cell_at(event)
+        if index is not None:
+            self.app.load_parameters(self.variants[index][1])
@@ -0,0 +1,13 @@
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+class InstrumentedCanvas(FigureCanvasTkAgg):
+    """FigureCanvasTkAgg that reports the start and end of every full draw to its app"""
+    def __init__(self, figure, master, app):
+        self.app = app
+        super().__init__(figure, master=master)
+
+    def draw(self):
+        self.app.before_draw()
+        super().draw()
+        self.app.after_draw()
@@ -0,0 +1,119 @@
+import numpy as np
+
+
+class VertexLabelLayer:
+    """Point labels that are culled to the viewport and never overlap
+
+    Label positions are kept in a uniform grid index, so a viewport query
+    only touches the grid cells it covers. Only labels that are inside the
+    view and do not overlap an already placed label are shown, using a pool
+    of Text artists that is reused from one update to the next.
+    """
+    # Above this many points in the visible cells, only one candidate per cell is considered
+    CANDIDATE_LIMIT = 5000
+
+    def __init__(self, ax, font_size=10, max_labels=300, **text_kwargs):
+        self.ax = ax
+        self.font_size = font_size
+        self.max_labels = max_labels
+        self.text_kwargs = text_kwargs
+        self.pool = []
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.labels = None
+
+    def set_points(self, x, y, labels=None):
+        """Replace the labelled points; labels defaults to each point's index"""
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.labels = labels
+
+        # Bucket the points into a roughly sqrt(n) x sqrt(n) grid, sorted by cell
+        n = self.x.size
+        self.grid_size = max(1, int(np.sqrt(n)))
+        if n == 0:
+            self.order = np.empty(0, dtype=int)
+            self.cell_starts = np.zeros(2, dtype=int)
+            return
+        self.x_min, self.x_max = self.x.min(), self.x.max()
+        self.y_min, self.y_max = self.y.min(), self.y.max()
+        self.cell_w = max(self.x_max - self.x_min, 1e-12) / self.grid_size
+        self.cell_h = max(self.y_max - self.y_min, 1e-12) / self.grid_size
+        cell = self._cell_ids(*self._cells(self.x, self.y))
+        self.order = np.argsort(cell, kind="stable")
+        self.cell_starts = np.searchsorted(cell[self.order], np.arange(self.grid_size ** 2 + 1))
+
+    def _cells(self, x, y):
+        ix = np.clip(((x - self.x_min) / self.cell_w).astype(int), 0, self.grid_size - 1)
+        iy = np.clip(((y - self.y_min) / self.cell_h).astype(int), 0, self.grid_size - 1)
+        return ix, iy
+
+    def _cell_ids(self, ix, iy):
+        return ix * self.grid_size + iy
+
+    def label_text(self, i):
+        return str(i) if self.labels is None else str(self.labels[i])
+
+    def query(self, xlim, ylim):
+        """Indices of candidate points inside the given view, from the grid index"""
+        if self.x.size == 0 or xlim[1] < self.x_min or xlim[0] > self.x_max or ylim[1] < self.y_min or ylim[0] > self.y_max:
+            return np.empty(0, dtype=int)
+
+        (ix0, ix1), (iy0, iy1) = self._cells(np.array(xlim), np.array(ylim))
+        ix, iy = np.meshgrid(np.arange(ix0, ix1 + 1), np.arange(iy0, iy1 + 1), indexing="ij")
+        cells = self._cell_ids(ix.ravel(), iy.ravel())
+        starts = self.cell_starts[cells]
+        counts = self.cell_starts[cells + 1] - starts
+
+        if counts.sum() <= self.CANDIDATE_LIMIT:
+            # Few enough points: take every point in the visible cells
+            candidates = np.concatenate([self.order[s:s + c] for s, c in zip(starts, counts) if c]) if counts.any() else np.empty(0, dtype=int)
+        else:
+            # Dense view: one representative per occupied cell keeps the cost bounded by the grid size
+            candidates = self.order[starts[counts > 0]]
+
+        inside = ((self.x[candidates] >= xlim[0]) & (self.x[candidates] <= xlim[1]) &
+                  (self.y[candidates] >= ylim[0]) & (self.y[candidates] <= ylim[1]))
+        return np.sort(candidates[inside])
+
+    def update(self):
+        """Place non-overlapping labels for the current view, reusing pooled Text artists"""
+        candidates = self.query(self.ax.get_xlim(), self.ax.get_ylim())
+
+        placed = []
+        if candidates.size:
+            pixels = self.ax.transData.transform(np.column_stack((self.x[candidates], self.y[candidates])))
+            char_w = self.font_size * 0.6 * self.ax.figure.dpi / 72
+            height = self.font_size * 1.2 * self.ax.figure.dpi / 72
+            max_w = len(self.label_text(candidates[-1])) * char_w
+
+            # Greedy placement; occupied boxes are bucketed by label size so each check looks at 3x3 buckets
+            occupied = {}
+            for i, (px, py) in zip(candidates, pixels):
+                width = len(self.label_text(i)) * char_w
+                bx, by = int(px // max_w), int(py // height)
+                clash = any(px < ox + ow and ox < px + width and py < oy + height and oy < py + height
+                            for nx in (bx - 1, bx, bx + 1)
+                            for ny in (by - 1, by, by + 1)
+                            for ox, oy, ow in occupied.get((nx, ny), ()))
+                if clash:
+                    continue
+                occupied.setdefault((bx, by), []).append((px, py, width))
+                placed.append(i)
+                if len(placed) >= self.max_labels:
+                    break
+
+        # Grow the pool on demand and hide the artists that are not needed
+        while len(self.pool) < len(placed):
+            self.pool.append(self.ax.text(0, 0, "", fontsize=self.font_size, clip_on=True, **self.text_kwargs))
+        for text, i in zip(self.pool, placed):
+            text.set_position((self.x[i], self.y[i]))
+            text.set_text(self.label_text(i))
+            text.set_visible(True)
+        for text in self.pool[len(placed):]:
+            text.set_visible(False)
+        return len(placed)
+
+    def artists(self):
+        """The visible Text artists"""
+        return [text for text in self.pool if text.get_visible()]
@@ -0,0 +1,52 @@
+import numpy as np
+
+
+# Cell ids of the four regions outside the view
+LEFT, RIGHT, BELOW, ABOVE = -1.0, -2.0, -3.0, -4.0
+
+# Pixels beyond the view edge still kept at full detail, since lines just outside it bleed in
+MARGIN_PX = 4
+
+
+def pixel_cells(x, y, xlim, ylim, width_px, height_px, margin_px=MARGIN_PX):
+    """Cell id of every point: its pixel inside the view, or one of four regions outside it
+
+    Outside the view and its margin, everything left or right of it forms
+    one half-plane cell each, and everything else above or below it one
+    strip cell each. Every cell is convex. NaN coordinates give a NaN id.
+    """
+    col = np.floor((x - xlim[0]) * (width_px / (xlim[1] - xlim[0]))) + margin_px
+    row = np.floor((y - ylim[0]) * (height_px / (ylim[1] - ylim[0]))) + margin_px
+    width = width_px + 2 * margin_px
+    height = height_px + 2 * margin_px
+    cell = col * height + row
+    cell[row < 0] = BELOW
+    cell[row >= height] = ABOVE
+    cell[col < 0] = LEFT
+    cell[col >= width] = RIGHT
+    return cell
+
+
+def decimate(x, y, xlim, ylim, width_px, height_px):
+    """Reduce a polyline to the vertices that matter at the given view and pixel size
+
+    Consecutive vertices that fall into the same cell (see pixel_cells) are
+    collapsed to the first and last vertex of their run. Every cell is convex, so the
+    shortened path never leaves the cells the original path passed through
+    and draws the same pixels, while the vertex count is bounded by the
+    path's length in pixels instead of its sample count. NaN breaks are
+    kept. Returns (x, y).
+    """
+    n = x.size
+    if n <= 2:
+        return x, y
+    cell = pixel_cells(x, y, xlim, ylim, width_px, height_px)
+
+    # A vertex is kept if it starts or ends a run of vertices in one cell
+    changed = cell[1:] != cell[:-1]
+    keep = np.empty(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    keep[1:-1] = changed[:-1] | changed[1:]
+
+    # NaN coordinates never compare equal, so gaps are kept along with their neighbours
+    return x[keep], y[keep]
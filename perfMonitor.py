@@ -0,0 +1,102 @@
+from collections import deque
+import csv
+import json
+import time
+
+import numpy as np
+
+
+class PerfMonitor:
+    """Ring buffer of per-phase timings for plot updates and redraws
+
+    A frame is opened with begin(), split into phases with mark() - each mark
+    records the time since the previous one - and closed with end(). Only the
+    most recent frames are kept.
+    """
+    def __init__(self, capacity=1000):
+        self.frames = deque(maxlen=capacity)
+        self._current = None
+        self._last = None
+
+    def begin(self, kind):
+        """Start timing a new frame, discarding any frame that was never finished"""
+        now = time.perf_counter()
+        self._current = {"kind": kind, "time": time.time(), "start": now, "phases": {}, "vertices": 0}
+        self._last = now
+
+    def mark(self, phase):
+        """Record the time since the previous mark as phase, opening an "update" frame if none is open"""
+        now = time.perf_counter()
+        if self._current is None:
+            self.begin("update")
+            self._last = now
+            return
+        phases = self._current["phases"]
+        phases[phase] = phases.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def end(self, vertices=0):
+        """Finish the current frame and store it in the ring buffer"""
+        if self._current is None:
+            return None
+        frame = self._current
+        frame["total"] = time.perf_counter() - frame["start"]
+        frame["vertices"] = vertices
+        del frame["start"]
+        self.frames.append(frame)
+        self._current = None
+        return frame
+
+    def record(self, kind, vertices=0, **phases):
+        """Store a frame whose phase durations were measured elsewhere"""
+        self.frames.append({"kind": kind, "time": time.time(), "phases": phases,
+                            "total": sum(phases.values()), "vertices": vertices})
+
+    def cancel(self):
+        """Drop the current frame without recording it"""
+        self._current = None
+
+    @property
+    def active(self):
+        return self._current is not None
+
+    @property
+    def has_phases(self):
+        """Whether the current frame has recorded any phase yet"""
+        return self._current is not None and bool(self._current["phases"])
+
+    def summary(self):
+        """Last, median and 95th percentile frame time in seconds, and the last vertex count"""
+        if not self.frames:
+            return None
+        totals = np.array([frame["total"] for frame in self.frames])
+        return {
+            "last": totals[-1],
+            "p50": float(np.percentile(totals, 50)),
+            "p95": float(np.percentile(totals, 95)),
+            "vertices": self.frames[-1]["vertices"],
+            "frames": len(totals),
+        }
+
+    def format_summary(self):
+        """One-line summary for the on-screen overlay"""
+        stats = self.summary()
+        if stats is None:
+            return "no frames yet"
+        return (f"last {stats['last'] * 1000:.1f} ms  p50 {stats['p50'] * 1000:.1f} ms  "
+                f"p95 {stats['p95'] * 1000:.1f} ms  {stats['vertices']:,} vertices")
+
+    def dump(self, path):
+        """Write the buffered frames to path, as CSV if it ends in .csv and JSON otherwise"""
+        frames = list(self.frames)
+        if path.lower().endswith(".csv"):
+            phases = sorted({phase for frame in frames for phase in frame["phases"]})
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["time", "kind", "total", "vertices"] + phases)
+                for frame in frames:
+                    writer.writerow([frame["time"], frame["kind"], frame["total"], frame["vertices"]] +
+                                    [frame["phases"].get(phase, "") for phase in phases])
+        else:
+            with open(path, "w") as f:
+                json.dump(frames, f, indent=2)
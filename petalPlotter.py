@@ -1,14 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib as mpl
+from tkinter import ttk
 
 from PlotApp import PlotApp
 
 class PetalPlotterApp(PlotApp):
+    SUPPORTS_GALLERY = True
+
     def __init__(self, root):
         # Set default parameters
         self.n_petals = 3
@@ -59,9 +57,15 @@ class PetalPlotterApp(PlotApp):
         face_info.grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 5))
         
         # Apply button
-        apply_button = ttk.Button(params_frame, text="Apply Changes", command=self.on_apply)
+        apply_button = ttk.Button(params_frame, text="Apply Changes", command=self.apply_changes)
         apply_button.grid(row=3, column=0, columnspan=2, padx=(0, 0), pady=(5, 0), sticky="ew")
         
+        # Optional live sliders
+        self.create_live_sliders(params_frame, 4, [
+            ("Petals", self.petals_var, 1, 20, True),
+            ("Face Radius", self.face_var, 0, 5, False),
+        ])
+        
         # Formula selection
         formula_frame = ttk.LabelFrame(self.control_frame, text="Formula Type", padding=10)
         formula_frame.grid(row=2, column=0, pady=(0, 20), sticky="ew")
@@ -219,72 +223,65 @@ Properties:
 • Face radius adds a central area""")
 
     def update_plot(self):
-        # Clear the previous plot
-        self.ax.clear()
-        
-        # Calculate the curve based on formula type
-        theta = np.linspace(0, self.max_theta, self.n_points)
-        
         formula_type = self.formula_type.get()
         
         if formula_type == "spiral_sin":
-            # Spiral formula with sin function - exact petal count
-            r = theta * np.sin((self.n_petals * theta) / 2) ** 2
             title = "Spiral Petal Pattern (Sin)"
             color = 'darkviolet'
             face_info = ""
             
         elif formula_type == "spiral_cos":
-            # Spiral formula with cos function - exact petal count
-            r = theta * np.cos((self.n_petals * theta) / 2) ** 2
             title = "Spiral Petal Pattern (Cos)"
             color = 'crimson'
             face_info = ""
             
         elif formula_type == "rhodonea_sin":
-            # Rhodonea curve with sin function - exact petal count
-            k = self.n_petals if self.n_petals % 2 == 1 else self.n_petals / 2
-            if self.n_petals % 2 == 1:
-                # odd: sin(kθ) gives k petals
-                r = np.sin(k * theta) + self.face_radius
-            else:
-                # even: use abs to fold negative radii back, giving k*2 = n petals
-                r = np.abs(np.sin(k * theta)) + self.face_radius
             title = "Rhodonea Pattern (Sin)"
             color = 'darkblue'
             face_info = f", Face Radius: {self.face_radius}"
 
         elif formula_type == "rhodonea_cos":
-            # Rhodonea curve with cos function - exact petal count
-            k = self.n_petals if self.n_petals % 2 == 1 else self.n_petals / 2
-            if self.n_petals % 2 == 1:
-                r = np.cos(k * theta) + self.face_radius
-            else:
-                r = np.abs(np.cos(k * theta)) + self.face_radius
             title = "Rhodonea Pattern (Cos)"
             color = 'darkgreen'
             face_info = f", Face Radius: {self.face_radius}"
         
-        # Convert to Cartesian coordinates
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
+        # Curve parameters for the selected formula
+        params = {"n_petals": self.n_petals}
+        if formula_type.startswith("rhodonea"):
+            params["face_radius"] = self.face_radius
         
         # Plot the curve
-        self.ax.plot(x, y, color=color, linewidth=1.5)
-        
-        # Set up the axis
-        self.ax.set_title(f"{title}\n(Exactly {self.n_petals} petals{face_info})", fontsize=14)
-        self.ax.set_aspect('equal')
-        self.ax.grid(True, linestyle='--', alpha=0.7)
-        
-        # Get good limits based on the data
-        max_range = max(abs(np.max(x)), abs(np.min(x)), abs(np.max(y)), abs(np.min(y)))
-        self.ax.set_xlim(-max_range*1.1, max_range*1.1)
-        self.ax.set_ylim(-max_range*1.1, max_range*1.1)
-        
-        # Update the figure
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self.plot_curve(formula_type, params, color=color, title=f"{title}\n(Exactly {self.n_petals} petals{face_info})")
+
+    def prefetch_candidates(self, curve_type, params):
+        """One petal more or fewer, then the same petals with the other formula types"""
+        n_petals = params["n_petals"]
+        candidates = [(curve_type, dict(params, n_petals=n))
+                      for n in (n_petals + 1, n_petals - 1) if 1 <= n <= 20]
+        for formula_type in ("spiral_sin", "spiral_cos", "rhodonea_sin", "rhodonea_cos"):
+            if formula_type != curve_type:
+                other = {"n_petals": n_petals}
+                if formula_type.startswith("rhodonea"):
+                    other["face_radius"] = self.face_radius
+                candidates.append((formula_type, other))
+        return candidates
+
+    def gallery_variants(self):
+        """Every petal count from 1 to 20 with the current formula type"""
+        formula_type = self.formula_type.get()
+        variants = []
+        for n in range(1, 21):
+            params = {"n_petals": n}
+            if formula_type.startswith("rhodonea"):
+                params["face_radius"] = self.face_radius
+            variants.append((f"{n} petals", params))
+        return formula_type, variants, 5
+
+    def load_parameters(self, params):
+        """Plot a petal count picked in the gallery"""
+        self.n_petals = params["n_petals"]
+        self.petals_var.set(str(self.n_petals))
+        self.update_plot()
 
     def on_apply(self):
         # Initialize variables to track if we need to update the plot
@@ -351,9 +348,6 @@ Properties:
         self.update_plot()
 
 def main():
-    # Configure matplotlib to use a more modern style
-    plt.style.use('ggplot')
-    
     # Create the tkinter root window
     root = tk.Tk()
     
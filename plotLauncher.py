@@ -0,0 +1,67 @@
+import tkinter as tk
+from tkinter import ttk
+
+from butterflyCurvePlotter import ButterflyPlotterApp
+from customCurvePlotter import CustomCurvePlotterApp
+from petalPlotter import PetalPlotterApp
+from starPolygonPlotter import StarPolygonPlotterApp
+
+# Tab label and app class of every plotter hosted by the launcher
+PLOTTERS = [
+    ("Butterfly Curve", ButterflyPlotterApp),
+    ("Petal Curves", PetalPlotterApp),
+    ("Star Polygon", StarPolygonPlotterApp),
+    ("Custom Curve", CustomCurvePlotterApp),
+]
+
+
+class PlotLauncher:
+    """Hosts every plotter as a notebook tab in one window and one process
+
+    The plotters share the interpreter, the matplotlib import and the curve
+    worker threads. Each plotter's widgets and figure are only built the
+    first time its tab is opened.
+    """
+    def __init__(self, root, plotters=PLOTTERS):
+        self.root = root
+        self.root.title("Curve Plotters")
+        self.root.state('zoomed')  # Make window full-screen on Windows
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.grid(row=0, column=0, sticky="nsew")
+
+        # Empty tab frames; the app classes are instantiated on first selection
+        self.app_classes = {}
+        self.apps = {}
+        for label, app_class in plotters:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=label)
+            self.app_classes[str(frame)] = app_class
+
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+
+    def on_tab_changed(self, event):
+        """Build the selected plotter if this is the first time its tab is shown"""
+        tab = self.notebook.select()
+        if tab not in self.apps:
+            self.apps[tab] = self.app_classes[tab](self.notebook.nametowidget(tab))
+
+    def current_app(self):
+        """The plotter in the selected tab"""
+        return self.apps.get(self.notebook.select())
+
+
+def main():
+    # Create the tkinter root window
+    root = tk.Tk()
+
+    # Create and run the launcher
+    launcher = PlotLauncher(root)
+
+    # Start the main loop
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
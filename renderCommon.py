@@ -0,0 +1,46 @@
+def parse_value(value):
+    """Convert a CSV cell or command-line value to int or float where possible"""
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_assignments(items):
+    """Parse NAME=VALUE strings, as given to the --set options, into a parameter dict"""
+    params = {}
+    for item in items:
+        name, value = item.split("=", 1)
+        params[name] = parse_value(value)
+    return params
+
+
+def curve_title(curve_type, params):
+    """Figure title naming the curve and its parameter values"""
+    # Expression curves also take string parameters, which have no numeric format
+    return curve_type + "\n" + ", ".join(
+        f"{key}: {value:g}" if isinstance(value, (int, float)) else f"{key}: {value}"
+        for key, value in params.items())
+
+
+def make_agg_figure(figsize=(10, 8), dpi=100, style=None):
+    """Create an off-screen figure with one axes set up like the plotters' plot area
+
+    The axes has an equal aspect and a dashed grid, as in
+    PlotApp.create_figure. style is applied first if given. Returns
+    (fig, canvas, ax).
+    """
+    import matplotlib.style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    if style:
+        matplotlib.style.use(style)
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.set_aspect('equal')
+    ax.grid(True, linestyle='--', alpha=0.7)
+    return fig, canvas, ax
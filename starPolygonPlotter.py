@@ -1,21 +1,40 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import tkinter as tk
 from tkinter import ttk, messagebox
-import math
-import matplotlib as mpl
 
 from PlotApp import PlotApp
+from labelLayer import VertexLabelLayer
+import curves
 
 class StarPolygonPlotterApp(PlotApp):
+    # The star is drawn as a LineCollection, which has no density mode
+    SUPPORTS_DENSITY = False
+    SUPPORTS_GALLERY = True
+    # Font size of the vertex labels, in points
+    LABEL_FONT_SIZE = 10
+    # Vertex markers are hidden once neighbouring vertices are closer than this many pixels
+    MIN_MARKER_SPACING = 8
+    # Rotating an edge by this many pixels or less leaves it on the same pixels, so such edges are thinned out
+    MAX_EDGE_SHIFT = 0.5
+    # Most variants shown in the gallery; larger p show this many evenly spaced q
+    GALLERY_MAX_VARIANTS = 100
+    # Most edges drawn per gallery cell, plenty to fill a cell a few hundred pixels wide
+    GALLERY_MAX_EDGES = 2000
+
     def __init__(self, root):
         # Initialize parameters
         self.p = 5  # Number of points (default to a regular pentagon)
         self.q = 2  # Connection step (default to connect every 2nd point)
         self.n_points = 1000  # Resolution for plotting
         
+        # Retained plot artists, created on the first update
+        self.polygon_line = None
+        self.star_lines = None
+        self.vertex_markers = None
+        self.label_layer = None
+        # View the edges, markers and labels were last thinned for
+        self._detail_view = None
+        
         # Initialize the base class
         super().__init__(root, "Star Polygon Plotter")
 
@@ -54,9 +73,15 @@ class StarPolygonPlotterApp(PlotApp):
         q_info.grid(row=3, column=0, columnspan=2, sticky="w", pady=(0, 10))
         
         # Apply button
-        apply_button = ttk.Button(params_frame, text="Apply Changes", command=self.on_apply)
+        apply_button = ttk.Button(params_frame, text="Apply Changes", command=self.apply_changes)
         apply_button.grid(row=4, column=0, columnspan=2, sticky="ew", pady=(10, 0))
         
+        # Optional live sliders
+        self.create_live_sliders(params_frame, 5, [
+            ("P", self.p_var, 3, 100, True),
+            ("Q", self.q_var, 1, 49, True),
+        ])
+        
         # Explanation
         explanation_frame = ttk.LabelFrame(self.control_frame, text="Star Polygon Information", padding=10)
         explanation_frame.grid(row=2, column=0, pady=(0, 20), sticky="ew")
@@ -147,71 +172,150 @@ Examples:
         self.q = q_value
         self.update_plot()
 
+    def gallery_variants(self):
+        """Every valid q for the current p, or GALLERY_MAX_VARIANTS of them spread evenly"""
+        qs = np.arange(1, (self.p + 1) // 2)
+        qs = qs[np.gcd(qs, self.p) == 1]
+        if len(qs) > self.GALLERY_MAX_VARIANTS:
+            qs = qs[np.linspace(0, len(qs) - 1, self.GALLERY_MAX_VARIANTS).round().astype(int)]
+        variants = [(f"{{{self.p}/{q}}}", {"p": self.p, "q": int(q)}) for q in qs]
+        return None, variants, int(np.ceil(np.sqrt(len(variants))))
+
+    def gallery_curves(self, curve_type, variants):
+        """Edges of every variant, one row per q, thinned to GALLERY_MAX_EDGES per star"""
+        stride = -(-self.p // self.GALLERY_MAX_EDGES)
+        return curves.star_polygon(self.p, [params["q"] for _, params in variants], stride)
+
+    def gallery_color(self):
+        """Stars are drawn in red, like the main view's edges"""
+        return 'r'
+
+    def load_parameters(self, params):
+        """Plot a q picked in the gallery"""
+        self.q = params["q"]
+        self.q_var.set(str(self.q))
+        self.update_plot()
+
+    def on_live_change(self):
+        """Apply slider changes, silently skipping combinations that are not valid stars"""
+        self._live_update_id = None
+        try:
+            p_value = int(self.p_var.get())
+            q_value = int(self.q_var.get())
+        except ValueError:
+            return
+        if p_value < 3 or q_value < 1 or q_value >= p_value/2 or not self.are_relatively_prime(p_value, q_value):
+            return
+        self.p = p_value
+        self.q = q_value
+        self.update_plot()
+
     def update_plot(self):
         """Update the star polygon plot with current parameters"""
-        # Clear the previous plot
-        self.ax.clear()
+        # The first render happens once the plot panel exists
+        if not hasattr(self, 'canvas'):
+            return
+        self.perf.mark("validate")
         
         # Calculate the points on the circle
-        theta = 2 * np.pi * np.arange(self.p) / self.p
-        x = np.cos(theta)
-        y = np.sin(theta)
-        
-        # Create a list of points for the star polygon
-        points_x = []
-        points_y = []
-        
-        # For drawing the star polygon with lines
-        for i in range(self.p):
-            # Start point
-            points_x.append(x[i])
-            points_y.append(y[i])
-            
-            # Connect to the point q steps away (wrapping around if needed)
-            target_idx = (i + self.q) % self.p
-            points_x.append(x[target_idx])
-            points_y.append(y[target_idx])
-            
-            # Add None to break the line for the next segment
-            points_x.append(None)
-            points_y.append(None)
+        x, y = curves.star_polygon_vertices(self.p)
+        
+        # Edges of the star polygon as a (p, 2, 2) segment array
+        self.segments = curves.star_polygon_segments(self.p, self.q)
+        self.perf.mark("compute")
         
-        # Plot the regular polygon outline (dashed)
+        # Regular polygon outline, closed back to the first point
         polygon_x = np.append(x, x[0])
         polygon_y = np.append(y, y[0])
-        self.ax.plot(polygon_x, polygon_y, 'b--', alpha=0.5, label="Regular Polygon")
-        
-        # Plot the star polygon (solid)
-        self.ax.plot(points_x, points_y, 'r-', linewidth=1.5, label="Star Polygon")
         
-        # Plot the points
-        self.ax.plot(x, y, 'ko', markersize=6)
-        
-        # Set up the axis
-        title = f"Star Polygon {{p/q}} = {{{self.p}/{self.q}}}"
-        self.ax.set_title(title, fontsize=14)
-        self.ax.set_aspect('equal')
-        self.ax.grid(True, linestyle='--', alpha=0.7)
+        if self.star_lines is None:
+            # Create the artists once; later updates change their data in place
+            self.polygon_line, = self.ax.plot(polygon_x, polygon_y, 'b--', alpha=0.5, label="Regular Polygon")
+            from matplotlib.collections import LineCollection
+            
+            self.star_lines = LineCollection(self.segments, colors='r', linewidths=1.5, label="Star Polygon")
+            self.ax.add_collection(self.star_lines)
+            self.vertex_markers, = self.ax.plot(x, y, 'ko', markersize=6)
+            self.label_layer = VertexLabelLayer(self.ax, font_size=self.LABEL_FONT_SIZE)
+            
+            # Add legend
+            self.ax.legend(loc='upper right')
+            
+            # Remove axis labels
+            self.ax.set_xticklabels([])
+            self.ax.set_yticklabels([])
+        else:
+            self.polygon_line.set_data(polygon_x, polygon_y)
+            self.vertex_markers.set_data(x, y)
         
-        # Add legend
-        self.ax.legend(loc='upper right')
+        # Vertex numbers sit just outside the circle
+        self.label_layer.set_points(x*1.1, y*1.1)
         
         # Set limits with a bit of padding
         padding = 0.2
         self.ax.set_xlim(-1-padding, 1+padding)
         self.ax.set_ylim(-1-padding, 1+padding)
         
-        # Remove axis labels
-        self.ax.set_xticklabels([])
-        self.ax.set_yticklabels([])
+        # Set up the title
+        self.set_title(f"Star Polygon {{p/q}} = {{{self.p}/{self.q}}}")
         
-        # Number the points (optional)
-        for i in range(self.p):
-            self.ax.annotate(str(i), (x[i]*1.1, y[i]*1.1), fontsize=10)
+        # Lay out first, so the detail is matched to the axes size it will be drawn at
+        self.update_layout()
+        self.ax.apply_aspect()
+        self.perf.mark("layout")
+        self.update_detail()
+        self.perf.mark("artists")
         
         # Update the figure
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+    def update_detail(self):
+        """Match the drawn edges, markers and labels to what is distinguishable at the current view"""
+        self._detail_view = self.view_key()
+        spacing = self.vertex_spacing()
+        
+        # Edge i + k is edge i rotated by k vertices; skip edges that would land on the same pixels
+        stride = max(1, int(self.MAX_EDGE_SHIFT / spacing))
+        self.star_lines.set_segments(self.segments[::stride])
+        
+        # Only draw vertex markers while neighbouring vertices are far enough apart to tell apart
+        self.vertex_markers.set_visible(spacing >= self.MIN_MARKER_SPACING)
+        
+        # Number the visible points that have room for a readable label
+        self.label_layer.update()
+
+    def on_view_settled(self):
+        """Refresh the level of detail once zooming or panning has settled"""
+        self._view_settle_id = None
+        if self.star_lines is None:
+            return
+        if self._zoom_background is not None:
+            # Still zooming, check again once the gesture is over
+            self._view_settle_id = self.root.after(self.ZOOM_SETTLE_MS, self.on_view_settled)
+            return
+        if self.view_key() == self._detail_view:
+            return
+        self.update_detail()
+        self.canvas.draw_idle()
+
+    def vertex_count(self):
+        """Number of vertices currently handed to matplotlib"""
+        if self.star_lines is None:
+            return 0
+        return 2 * len(self.star_lines.get_segments()) + 2 * self.p + 1
+
+    def vertex_spacing(self):
+        """Distance in pixels between neighbouring vertices at the current view"""
+        xlim = self.ax.get_xlim()
+        radius_px = self.ax.bbox.width / (xlim[1] - xlim[0])
+        return 2 * np.pi * radius_px / self.p
+
+    def animated_artists(self):
+        """Artists redrawn on top of the cached background while zooming"""
+        if self.star_lines is None:
+            return []
+        return [self.polygon_line, self.star_lines, self.vertex_markers] + self.label_layer.artists()
+
     def reset_view(self):
         """Reset the view to default"""
         # Reset parameters to default values
@@ -226,9 +330,6 @@ Examples:
         self.update_plot()
 
 def main():
-    # Configure matplotlib to use a more modern style
-    plt.style.use('ggplot')
-    
     # Create the tkinter root window
     root = tk.Tk()
     
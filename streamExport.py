@@ -0,0 +1,105 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import curves
+from batchRender import CURVE_COLORS
+from renderCommon import curve_title, make_agg_figure, parse_assignments
+
+
+def export_points(path, curve_type, n_points, max_theta, chunk_size=curves.STREAM_CHUNK_POINTS, **params):
+    """Write the curve's points to a memory-mapped .npy file of shape (n_points, 2), chunk by chunk
+
+    Each chunk is written through its own small mapping of the file, so
+    neither the points nor the mapped pages accumulate in memory.
+    """
+    points = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(n_points, 2))
+    data_offset = points.offset
+    del points
+
+    count = 0
+    for x, y in curves.iter_chunks(curve_type, n_points, max_theta, chunk_size, **params):
+        window = np.memmap(path, dtype=np.float64, mode="r+", offset=data_offset + count * 2 * 8,
+                           shape=(x.size, 2))
+        window[:, 0] = x
+        window[:, 1] = y
+        window.flush()
+        del window
+        count += x.size
+    return count
+
+
+def curve_extent(curve_type, n_points, max_theta, chunk_size=curves.STREAM_CHUNK_POINTS, **params):
+    """Largest |x| or |y| of the curve, found in one streaming pass"""
+    extent = 0.0
+    for x, y in curves.iter_chunks(curve_type, n_points, max_theta, chunk_size, **params):
+        extent = max(extent, np.nanmax(np.abs(x)), np.nanmax(np.abs(y)))
+    return extent
+
+
+def render_stream(path, curve_type, n_points, max_theta, chunk_size=curves.STREAM_CHUNK_POINTS,
+                  figsize=(10, 8), dpi=100, style='ggplot', extent=None, **params):
+    """Render the curve to a raster image, drawing one chunk at a time onto the same Agg buffer
+
+    The axes are drawn once, then each chunk is drawn on top as its own
+    line, joined to the previous chunk's last point, so the curve is never
+    held in memory as a whole. extent sets the axis limits to ±1.1×extent;
+    by default it is found with an extra streaming pass.
+    """
+    import matplotlib.image
+
+    if extent is None:
+        extent = curve_extent(curve_type, n_points, max_theta, chunk_size, **params)
+
+    fig, canvas, ax = make_agg_figure(figsize, dpi, style)
+    ax.set_xlim(-extent*1.1, extent*1.1)
+    ax.set_ylim(-extent*1.1, extent*1.1)
+    ax.set_title(curve_title(curve_type, params), fontsize=14)
+    line, = ax.plot([], [], color=CURVE_COLORS.get(curve_type, 'purple'), linewidth=1.5)
+    fig.tight_layout()
+
+    # Draw the empty axes, then accumulate the chunks on the same buffer
+    canvas.draw()
+    last = None
+    for x, y in curves.iter_chunks(curve_type, n_points, max_theta, chunk_size, **params):
+        if last is not None:
+            x = np.concatenate(([last[0]], x))
+            y = np.concatenate(([last[1]], y))
+        line.set_data(x, y)
+        ax.draw_artist(line)
+        last = (x[-1], y[-1])
+
+    matplotlib.image.imsave(path, np.asarray(canvas.buffer_rgba()), dpi=dpi)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a very long curve to a .npy point file or an image")
+    parser.add_argument("curve", choices=sorted(curves.CURVES))
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="Curve parameter value; repeat for several")
+    parser.add_argument("-n", "--n-points", type=float, default=1e8)
+    parser.add_argument("--max-theta", type=float, default=24 * np.pi)
+    parser.add_argument("--chunk-size", type=float, default=curves.STREAM_CHUNK_POINTS)
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--size", type=float, nargs=2, default=(10, 8), metavar=("WIDTH", "HEIGHT"),
+                        help="Figure size in inches")
+    parser.add_argument("-o", "--output", default="curve.npy", help=".npy for the points, an image path to render")
+    args = parser.parse_args()
+
+    params = parse_assignments(args.set)
+
+    n_points, chunk_size = int(args.n_points), int(args.chunk_size)
+    start = time.perf_counter()
+    if args.output.lower().endswith(".npy"):
+        export_points(args.output, args.curve, n_points, args.max_theta, chunk_size, **params)
+    else:
+        render_stream(args.output, args.curve, n_points, args.max_theta, chunk_size,
+                      figsize=tuple(args.size), dpi=args.dpi, **params)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {n_points:,} points in {elapsed:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import argparse
+import multiprocessing
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import curves
+from batchRender import CURVE_COLORS
+from renderCommon import curve_title, make_agg_figure, parse_assignments
+
+# Per-process figure, created once by the pool initializer and reused for every frame
+_worker = {}
+
+
+class FFmpegWriter:
+    """Stream raw RGBA frames into a locally installed ffmpeg, which encodes GIF or MP4 by file extension"""
+    def __init__(self, path, width, height, fps=30, ffmpeg="ffmpeg"):
+        command = [ffmpeg, "-y", "-loglevel", "error",
+                   "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps),
+                   "-i", "-"]
+        if path.lower().endswith(".gif"):
+            command += ["-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse"]
+        else:
+            # H.264 needs even frame dimensions
+            command += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p"]
+        self.process = subprocess.Popen(command + [path], stdin=subprocess.PIPE)
+
+    def write(self, frame):
+        self.process.stdin.write(frame)
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {self.process.returncode}")
+
+
+class RawWriter:
+    """Write raw RGBA frames back to back to a file, or to stdout for path '-'"""
+    def __init__(self, path, width, height, fps=30):
+        self.file = sys.stdout.buffer if path == "-" else open(path, "wb")
+
+    def write(self, frame):
+        self.file.write(frame)
+
+    def close(self):
+        if self.file is not sys.stdout.buffer:
+            self.file.close()
+
+
+def _init_worker(figsize, dpi, style):
+    """Create the Agg figure and the single reusable Line2D for this process"""
+    fig, canvas, ax = make_agg_figure(figsize, dpi, style)
+    line, = ax.plot([], [], linewidth=1.5)
+    title = ax.set_title("", fontsize=14)
+    fig.tight_layout()
+    _worker.update(fig=fig, canvas=canvas, ax=ax, line=line, title=title)
+
+
+def render_frame(curve_type, params, n_points, max_theta):
+    """Draw one parameter set on the worker's figure and return the Agg RGBA buffer as bytes"""
+    canvas = _worker["canvas"]
+    ax = _worker["ax"]
+    line = _worker["line"]
+
+    x, y = curves.evaluate(curve_type, n_points, max_theta, use_cache=False, **params)
+    line.set_data(x, y)
+    line.set_color(CURVE_COLORS.get(curve_type, 'purple'))
+    max_range = max(np.nanmax(np.abs(x)), np.nanmax(np.abs(y)))
+    ax.set_xlim(-max_range*1.1, max_range*1.1)
+    ax.set_ylim(-max_range*1.1, max_range*1.1)
+    # The layout leaves room for the title, so it is redone whenever the title's height changes
+    title = _worker["title"]
+    text = curve_title(curve_type, params)
+    relayout = text.count("\n") != title.get_text().count("\n")
+    title.set_text(text)
+    if relayout:
+        _worker["fig"].tight_layout()
+
+    canvas.draw()
+    return bytes(canvas.buffer_rgba())
+
+
+def _render_task(args):
+    return render_frame(*args)
+
+
+def frame_size(figsize, dpi):
+    """Pixel (width, height) of frames rendered at figsize and dpi"""
+    return int(round(figsize[0] * dpi)), int(round(figsize[1] * dpi))
+
+
+def export_sweep(curve_type, base_params, parameter, values, path, n_points, max_theta,
+                 fps=30, figsize=(8, 6.4), dpi=100, workers=None, writer=None, style='ggplot', context=None):
+    """Render one frame per value of parameter and stream the frames to path
+
+    Frames are rendered across a process pool in batches of a few frames
+    per worker and written in order as each batch completes, so memory use
+    stays constant however long the sweep is. writer defaults to ffmpeg for
+    .gif/.mp4 paths and raw RGBA frames otherwise. context names the
+    multiprocessing start method, e.g. "spawn"; None uses the platform's
+    default. Returns the number of frames written.
+    """
+    width, height = frame_size(figsize, dpi)
+    if writer is None:
+        writer = FFmpegWriter if path.lower().endswith((".gif", ".mp4")) else RawWriter
+    out = writer(path, width, height, fps)
+
+    workers = workers or multiprocessing.cpu_count()
+    batch = workers * 4
+    count = 0
+    try:
+        with multiprocessing.get_context(context).Pool(workers, initializer=_init_worker, initargs=(figsize, dpi, style)) as pool:
+            for start in range(0, len(values), batch):
+                tasks = [(curve_type, dict(base_params, **{parameter: value}), n_points, max_theta)
+                         for value in values[start:start + batch]]
+                for frame in pool.imap(_render_task, tasks):
+                    out.write(frame)
+                    count += 1
+    finally:
+        out.close()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export an animation that sweeps one curve parameter")
+    parser.add_argument("curve", choices=sorted(curves.CURVES))
+    parser.add_argument("parameter", help="Name of the parameter to sweep, e.g. wing_amplitude")
+    parser.add_argument("start", type=float)
+    parser.add_argument("stop", type=float)
+    parser.add_argument("-n", "--frames", type=int, default=100)
+    parser.add_argument("--integer", action="store_true", help="Round swept values to whole numbers")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="Fixed parameter value; repeat for several")
+    parser.add_argument("--n-points", type=int, default=5000)
+    parser.add_argument("--max-theta", type=float, default=24 * np.pi)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("-o", "--output", default="sweep.gif", help=".gif/.mp4 via ffmpeg, '-' or other paths for raw RGBA")
+    args = parser.parse_args()
+
+    base_params = parse_assignments(args.set)
+
+    values = np.linspace(args.start, args.stop, args.frames)
+    if args.integer:
+        values = np.unique(np.round(values).astype(int))
+    values = values.tolist()
+
+    start = time.perf_counter()
+    count = export_sweep(args.curve, base_params, args.parameter, values, args.output,
+                         args.n_points, args.max_theta, fps=args.fps, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {count} frames in {elapsed:.2f} s ({count / elapsed:.1f} frames/sec)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
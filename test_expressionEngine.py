@@ -0,0 +1,78 @@
+import inspect
+
+import numpy as np
+import pytest
+
+import curves
+import expressionEngine
+from expressionEngine import ExpressionError, compile_expression, parse_parameters
+
+POLAR = curves.POLAR_VARIABLES
+
+
+@pytest.mark.parametrize("text", [
+    "theta.__class__",
+    "(lambda: 1)()",
+    "[theta][0]",
+    "__import__('os')",
+    "open('x')",
+    "'a' * 3",
+    "sin(theta, out=theta)",
+    "0 < theta < 1",
+    "theta if theta else 1",
+    "True + theta",
+])
+def test_rejects_syntax_outside_whitelist(text):
+    with pytest.raises(ExpressionError):
+        compile_expression(text, POLAR)
+
+
+def test_rejects_unknown_names():
+    with pytest.raises(ExpressionError, match="Unknown name"):
+        compile_expression("theta * k", POLAR)
+
+
+def test_integer_powers_overflow_instead_of_hanging():
+    function = compile_expression("theta + 9**9**9", POLAR)
+    with pytest.raises(OverflowError):
+        function(theta=1.0, θ=1.0)
+
+
+def test_rejects_huge_literals():
+    with pytest.raises(ExpressionError):
+        compile_expression("1" + "0" * 400, POLAR)
+
+
+@pytest.mark.parametrize("name", ["theta", "θ", "t", "n_points", "max_theta", "resolution", "expression",
+                                  "x_expression", "sin", "pi"])
+def test_rejects_reserved_parameter_names(name):
+    with pytest.raises(ExpressionError):
+        parse_parameters(f"{name}=1")
+
+
+def test_reserved_names_cover_evaluate_arguments():
+    for function in (curves.evaluate, curves.evaluate_viewport, curves.polar_expression,
+                     curves.parametric_expression):
+        names = {name for name, p in inspect.signature(function).parameters.items()
+                 if p.kind is not p.VAR_KEYWORD}
+        assert names <= expressionEngine.RESERVED_NAMES
+
+
+def test_parse_parameters():
+    assert parse_parameters("a=1, b=2.5") == {"a": 1.0, "b": 2.5}
+
+
+def test_hyperbolic_spiral_is_refined_and_finite():
+    with np.errstate(all="ignore"):
+        x, y = curves.evaluate("polar_expression", 5000, 24 * np.pi, use_cache=False, resolution=800,
+                               expression="1/theta")
+    assert not np.isinf(x).any() and not np.isinf(y).any()
+    assert np.isnan(x).sum() == np.isnan(y).sum() == 1
+    assert x.size > 200
+
+
+def test_frequency_hint_parses_each_text_once():
+    expressionEngine._largest_literal.cache_clear()
+    for a in range(5):
+        assert expressionEngine.frequency_hint("sin(7*theta)", params={"a": a}) == 7.0
+    assert expressionEngine._largest_literal.cache_info().misses == 1